@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Any, Dict, Sequence, Tuple
 
+import numpy as np
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 from matplotlib.figure import Figure
 from matplotlib.widgets import Cursor
 try:
@@ -19,7 +22,9 @@ except Exception:  # pragma: no cover
 class MplCanvas(QWidget):
     """
     Qt widget composing a Matplotlib FigureCanvas with a small readout QLabel.
-    Provides a simple API: clear(), plot_xy(...), render(), set_readout_units(xu, yu).
+    Provides a simple API: clear(), plot_xy(...), update_line(...),
+    plot_or_update_line(...), update_curves(...), set_vline(x), render(),
+    set_readout_units(xu, yu).
     """
 
     def __init__(self) -> None:
@@ -34,6 +39,14 @@ class MplCanvas(QWidget):
         self._units: Tuple[str, str] = ("", "")  # (x_unit, y_unit)
         # Test hook: store last plotted point count (len(x) from last plot_xy call)
         self.last_points_count = 0
+        # Line2D owned by update_line(); dropped whenever the axis is cleared
+        self._line = None
+        # Labelled Line2Ds owned by plot_or_update_line(); same lifetime as _line
+        self._lines: Dict[str, Any] = {}
+        # Vertical marker owned by set_vline(); same lifetime as _line
+        self._vline = None
+        # Shared-x curve bundle owned by update_curves(); same lifetime as _line
+        self._curves = None
         # Layout
         lay = QVBoxLayout(self)
         lay.setContentsMargins(0, 0, 0, 0)
@@ -54,6 +67,10 @@ class MplCanvas(QWidget):
             if not _qt_is_valid(self):
                 return
             self.ax.clear()
+            self._line = None
+            self._lines = {}
+            self._vline = None
+            self._curves = None
         except RuntimeError:
             pass
 
@@ -76,6 +93,10 @@ class MplCanvas(QWidget):
                 return
             # reset axis
             self.ax.clear()
+            self._line = None
+            self._lines = {}
+            self._vline = None
+            self._curves = None
             # record point count for tests (gracefully handle sequences without __len__)
             try:
                 self.last_points_count = len(x)  # type: ignore[arg-type]
@@ -97,6 +118,116 @@ class MplCanvas(QWidget):
         except RuntimeError:
             pass
 
+    def update_line(
+        self,
+        x,
+        y,
+        label: str = "",
+        xlabel: str = "",
+        ylabel: str = "",
+        title: str = "",
+        grid: bool = True,
+    ) -> None:
+        """
+        Like plot_xy(), but keep the Line2D between calls: after the first call only the
+        line data and title are updated and the view is rescaled, skipping axis teardown
+        and artist construction. Call render() afterwards as usual.
+        """
+        try:
+            if not _qt_is_valid(self):
+                return
+            line = self._line
+            if line is None or line not in self.ax.lines:
+                self.plot_xy(
+                    x, y, label=label, xlabel=xlabel, ylabel=ylabel, title=title, grid=grid
+                )
+                self._line = self.ax.lines[-1] if self.ax.lines else None
+                return
+            try:
+                self.last_points_count = len(x)  # type: ignore[arg-type]
+            except Exception:  # pragma: no cover - defensive
+                self.last_points_count = 0
+            line.set_data(x, y)
+            if title:
+                self.ax.set_title(title)
+            if label and label != line.get_label():
+                line.set_label(label)
+                self.ax.legend()
+            self.ax.relim()
+            self.ax.autoscale_view()
+        except RuntimeError:
+            pass
+
+    def plot_or_update_line(self, label: str, x, y) -> None:
+        """
+        Keep one Line2D per label on the current axis: the first call for a label adds the
+        line (with grid and legend), later calls only swap its data and rescale the view.
+        Several labels can share the axis; clear()/plot_xy() drop them all.
+        """
+        try:
+            if not _qt_is_valid(self):
+                return
+            # float64 arrays are handed to the Line2D as-is (no per-update conversion copy)
+            x = np.asarray(x, dtype=np.float64)
+            y = np.asarray(y, dtype=np.float64)
+            line = self._lines.get(label)
+            if line is None or line not in self.ax.lines:
+                (line,) = self.ax.plot(x, y, label=label)
+                self._lines[label] = line
+                self.ax.grid(True)
+                self.ax.legend()
+            else:
+                line.set_data(x, y)
+            self.last_points_count = int(x.shape[0])
+            self.ax.relim()
+            self.ax.autoscale_view()
+        except RuntimeError:
+            pass
+
+    def update_curves(self, x, ys: Sequence[Any], labels: Sequence[str]) -> None:
+        """
+        Draw several curves over the same x as one LineCollection (one artist instead of
+        one Line2D per curve). The first call adds the collection and a legend built from
+        proxy lines; later calls only replace the segments and rescale the view.
+        """
+        try:
+            if not _qt_is_valid(self):
+                return
+            x = np.asarray(x, dtype=np.float64)
+            segs = [np.column_stack((x, np.asarray(y, dtype=np.float64))) for y in ys]
+            lc = self._curves
+            if lc is None or lc not in self.ax.collections:
+                colors = [f"C{i}" for i in range(len(segs))]
+                lc = LineCollection(segs, colors=colors)
+                self.ax.add_collection(lc)
+                self._curves = lc
+                self.ax.grid(True)
+                handles = [Line2D([], [], color=c, label=lab) for c, lab in zip(colors, labels)]
+                self.ax.legend(handles=handles)
+            else:
+                lc.set_segments(segs)
+            self.last_points_count = int(x.shape[0])
+            # relim() does not look at collections: rebuild the data limits from the segments
+            self.ax.ignore_existing_data_limits = True
+            for seg in segs:
+                self.ax.update_datalim(seg)
+            self.ax.autoscale_view()
+        except RuntimeError:
+            pass
+
+    def set_vline(self, x: float) -> None:
+        """Show one dashed vertical marker at x; later calls move it. clear() removes it."""
+        try:
+            if not _qt_is_valid(self):
+                return
+            line = self._vline
+            if line is None or line not in self.ax.lines:
+                self._vline = self.ax.axvline(x, color="gray", linestyle="--", linewidth=0.8)
+            else:
+                line.set_xdata([x, x])
+        except RuntimeError:
+            pass
+
     def render(self) -> None:
         try:
             if not _qt_is_valid(self):
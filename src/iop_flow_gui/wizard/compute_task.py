@@ -0,0 +1,37 @@
+"""Background run_all for wizard steps: one QRunnable per compute, result back by signal."""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from iop_flow.schemas import Session
+
+__all__ = ["RunAllSignals", "RunAllTask"]
+
+
+class RunAllSignals(QObject):
+    finished = Signal(object, object)  # (token, result dict or Exception)
+
+
+class RunAllTask(QRunnable):
+    """run_all on a (frozen) Session in the global thread pool; result goes back by signal."""
+
+    def __init__(self, session: Session, kwargs: Dict[str, Any], token: Any) -> None:
+        super().__init__()
+        # Owned by the step (kept in its _task) rather than deleted by the pool from C++
+        self.setAutoDelete(False)
+        self.signals = RunAllSignals()
+        self._session = session
+        self._kwargs = kwargs
+        self._token = token
+
+    def run(self) -> None:
+        from iop_flow.api import run_all
+
+        try:
+            result: Any = run_all(self._session, **self._kwargs)
+        except Exception as e:  # pragma: no cover - reported to the GUI thread
+            result = e
+        self.signals.finished.emit(self._token, result)
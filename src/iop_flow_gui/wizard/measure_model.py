@@ -0,0 +1,622 @@
+"""Table model for raw measurement rows (lift/flow/dp/swirl) backed by a NumPy array.
+
+Cells are stored as float64 in an (N, 4) array with NaN marking an empty cell, so
+scans over the table (save, counts, peaks) are vectorized instead of walking
+per-cell QTableWidgetItem wrappers. The test-plan (lift, dp) table uses the same
+layout with two columns.
+"""
+
+from __future__ import annotations
+
+import io
+import math
+import warnings
+from collections import OrderedDict
+from dataclasses import dataclass
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRegularExpression,
+    Qt,
+    Signal,
+)
+from PySide6.QtGui import QBrush, QColor, QRegularExpressionValidator
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QLineEdit,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QWidget,
+)
+
+try:  # allow import when loaded via spec_from_file_location in tests
+    from .state import parse_float_pl, parse_rows_counted  # type: ignore[relative-beyond-top-level]
+except Exception:  # pragma: no cover
+    from iop_flow_gui.wizard.state import parse_float_pl, parse_rows_counted  # type: ignore[no-redef]
+
+
+COLUMNS: Tuple[str, ...] = ("lift_mm", "q_cfm", "dp_inH2O", "swirl_rpm")
+# Column indices into COLUMNS / the (N, 4) cell array
+COL_LIFT, COL_Q, COL_DP, COL_SWIRL = 0, 1, 2, 3
+# Test-plan table: lift with an optional per-point dp
+PLAN_COLUMNS: Tuple[str, ...] = ("lift_mm", "dp_inH2O")
+
+# Custom role: everything the delegate paints for a cell, fetched in one data() call
+MULTIPLE_ROLES = int(Qt.UserRole) + 1
+_ALIGN_NUM = Qt.AlignRight | Qt.AlignVCenter
+_COMMA_TO_DOT = str.maketrans({",": "."})
+# Tooltip per column for a cell that fails its rule (see MeasureTableModel.cell_ok)
+_INVALID_TIPS: Tuple[str, ...] = (">= 0", ">= 0", "> 0 lub puste", ">= 0 lub puste")
+# Light red: the cell text stays readable
+_INVALID_BRUSH = QBrush(QColor(255, 200, 200))
+# Editor input parse_float_pl can take: sign, ',' or '.' decimal, space/NBSP separators, exponent
+_NUM_INPUT_RE = "[+-]?[0-9 \u00a0]*[.,]?[0-9 \u00a0]*(?:[eE][+-]?[0-9]+)?"
+
+
+@contextmanager
+def batch_updates(view: QAbstractItemView) -> Iterator[None]:
+    """
+    Suspend repaints of `view` while its model is bulk-mutated (paste, load, autofill);
+    one viewport update at the end. Model signals stay live so the view keeps in sync.
+    """
+    view.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        view.setUpdatesEnabled(True)
+        view.viewport().update()
+
+
+def rows_to_array(rows: Iterable[Dict[str, Any]]) -> np.ndarray:
+    """Pack state rows into an (N, 4) float64 array; missing/None values become NaN."""
+    out: List[List[float]] = []
+    for row in rows:
+        vals: List[float] = []
+        for key in COLUMNS:
+            v = row.get(key)
+            try:
+                vals.append(float(v) if v is not None else np.nan)
+            except (TypeError, ValueError):
+                vals.append(np.nan)
+        out.append(vals)
+    if not out:
+        return np.full((0, len(COLUMNS)), np.nan)
+    return np.asarray(out, dtype=np.float64)
+
+
+def round_lifts(lifts: np.ndarray) -> np.ndarray:
+    """
+    Lifts rounded to 3 decimals with Python's round, the way the state keys them;
+    np.round disagrees on x.xxx5 values (1.8705 -> 1.87 instead of 1.871).
+    """
+    return np.array([round(v, 3) for v in lifts.tolist()], dtype=np.float64)
+
+
+def clean_array(arr: np.ndarray) -> np.ndarray:
+    """
+    Normalize table cells the way they are saved: skip rows without lift or q, clamp
+    lift/q to >= 0 (lift rounded to 3 decimals), blank dp <= 0 and swirl < 0, keep the
+    last row per lift, sort by lift.
+    """
+    valid = ~np.isnan(arr[:, COL_LIFT]) & ~np.isnan(arr[:, COL_Q])
+    a = arr[valid]
+    if a.shape[0] == 0:
+        return np.full((0, len(COLUMNS)), np.nan)
+    lifts = round_lifts(np.maximum(a[:, COL_LIFT], 0.0))
+    # np.unique on the reversed lifts picks the last occurrence and returns lifts sorted
+    _, idx_rev = np.unique(lifts[::-1], return_index=True)
+    sel = a.shape[0] - 1 - idx_rev
+    out = a[sel].copy()
+    out[:, COL_LIFT] = lifts[sel]
+    out[:, COL_Q] = np.maximum(out[:, COL_Q], 0.0)
+    with np.errstate(invalid="ignore"):
+        out[~(out[:, COL_DP] > 0), COL_DP] = np.nan
+        out[~(out[:, COL_SWIRL] >= 0), COL_SWIRL] = np.nan
+    return out
+
+
+def lift_key(lift: float) -> int:
+    """Integer dedupe key for a lift in mm (lifts are kept to 3 decimals)."""
+    return int(round(lift * 1000.0))
+
+
+def merge_lifts(rows: List[Dict[str, Any]], lifts: Iterable[float]) -> List[Dict[str, Any]]:
+    """
+    Merge plan lifts into measurement rows in one two-pointer pass over both sorted
+    sequences: existing rows are kept as they are (not copied), a lift without a row
+    becomes {"lift_mm": lift}. Returns `rows` itself when every lift is already present.
+    """
+    keys = [lift_key(r.get("lift_mm") or 0.0) for r in rows]
+    if any(a > b for a, b in zip(keys, keys[1:])):
+        order = sorted(range(len(rows)), key=keys.__getitem__)
+        rows = [rows[i] for i in order]
+        keys = [keys[i] for i in order]
+    out: List[Dict[str, Any]] = []
+    i, n = 0, len(rows)
+    last: Optional[int] = None
+    for lift in sorted(lifts):
+        k = lift_key(lift)
+        if k == last:
+            continue
+        last = k
+        while i < n and keys[i] < k:
+            out.append(rows[i])
+            i += 1
+        if i < n and keys[i] == k:
+            continue
+        out.append({"lift_mm": lift})
+    if len(out) == i:
+        return rows  # nothing added
+    out.extend(rows[i:])
+    return out
+
+
+def array_to_rows(arr: np.ndarray) -> List[Dict[str, Any]]:
+    """Convert table cells to state rows (see clean_array for the rules)."""
+    a = clean_array(arr)
+    rows: List[Dict[str, Any]] = []
+    for lift, q, dp, swirl in a.tolist():
+        row: Dict[str, Any] = {"lift_mm": lift, "q_cfm": q}
+        if not math.isnan(dp):
+            row["dp_inH2O"] = dp
+        if not math.isnan(swirl):
+            row["swirl_rpm"] = swirl
+        rows.append(row)
+    return rows
+
+
+@dataclass
+class MeasureColumns:
+    """
+    Column-wise (SoA) view of saved measurement rows: one float64 array per field, NaN
+    where a row has no dp/swirl. The wizard state keeps list-of-dict rows (JSON, other
+    steps); this is the form used for counts and peak scans.
+    """
+
+    lift_mm: np.ndarray
+    q_cfm: np.ndarray
+    dp_inH2O: np.ndarray
+    swirl_rpm: np.ndarray
+
+    @classmethod
+    def from_array(cls, arr: np.ndarray) -> "MeasureColumns":
+        return cls(*(np.ascontiguousarray(arr[:, j]) for j in range(len(COLUMNS))))
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]]) -> "MeasureColumns":
+        return cls.from_array(rows_to_array(rows))
+
+    def to_rows(self) -> List[Dict[str, Any]]:
+        return array_to_rows(
+            np.column_stack((self.lift_mm, self.q_cfm, self.dp_inH2O, self.swirl_rpm))
+        )
+
+    def __len__(self) -> int:
+        return int(self.lift_mm.shape[0])
+
+    def count_dp(self) -> int:
+        return int(np.count_nonzero(~np.isnan(self.dp_inH2O)))
+
+    def count_swirl(self) -> int:
+        return int(np.count_nonzero(~np.isnan(self.swirl_rpm)))
+
+
+def _loadtxt_block(text: str) -> Optional[np.ndarray]:
+    """
+    C-level parse of a uniform whitespace/tab separated block (2-4 columns, ',' or '.'
+    decimals). Returns None when the text needs the tolerant line-by-line parser.
+    """
+    if ";" in text or "\xa0" in text:
+        return None
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")  # empty input warns instead of raising
+            arr = np.loadtxt(
+                io.StringIO(text.translate(_COMMA_TO_DOT)),
+                dtype=np.float64,
+                comments=None,
+                ndmin=2,
+            )
+    except (ValueError, UserWarning):
+        return None
+    if not 2 <= arr.shape[1] <= len(COLUMNS) or not np.isfinite(arr).all():
+        return None
+    return arr
+
+
+def parse_rows_array(text: str) -> np.ndarray:
+    """
+    Parse pasted rows straight into an (K, 4) cell block (NaN for absent dp/swirl).
+
+    Same acceptance rules as parse_rows (lift>=0, q>=0, dp>0, swirl>=0, lift rounded to
+    3 decimals). A clean rectangular block goes through np.loadtxt; anything irregular
+    (semicolons, ragged or bad rows) falls back to parse_rows.
+    """
+    return parse_rows_array_counted(text)[0]
+
+
+def parse_rows_array_counted(text: str) -> Tuple[np.ndarray, int]:
+    """parse_rows_array plus the number of rejected rows (see parse_rows_counted)."""
+    arr = _loadtxt_block(text) if text.strip() else None
+    if arr is None:
+        rows, bad = parse_rows_counted(text)
+        if not rows:
+            return np.full((0, len(COLUMNS)), np.nan), bad
+        block = np.array(
+            [[v if v is not None else np.nan for v in row] for row in rows], dtype=np.float64
+        )
+        return block, bad
+    out = np.full((arr.shape[0], len(COLUMNS)), np.nan)
+    out[:, : arr.shape[1]] = arr
+    ok = (out[:, COL_LIFT] >= 0) & (out[:, COL_Q] >= 0)
+    if arr.shape[1] > COL_DP:
+        ok &= out[:, COL_DP] > 0
+    if arr.shape[1] > COL_SWIRL:
+        ok &= out[:, COL_SWIRL] >= 0
+    out = out[ok]
+    out[:, COL_LIFT] = round_lifts(out[:, COL_LIFT])
+    return out, int(arr.shape[0] - out.shape[0])
+
+
+def invalid_mask(arr: np.ndarray) -> np.ndarray:
+    """(N, 4) bool mask of cells breaking their save rule (see MeasureTableModel.cell_ok)."""
+    bad = np.zeros(arr.shape, dtype=bool)
+    if arr.shape[0]:
+        bad[:, COL_LIFT] = ~(arr[:, COL_LIFT] >= 0.0)  # NaN compares False: missing is bad
+        bad[:, COL_Q] = ~(arr[:, COL_Q] >= 0.0)
+        bad[:, COL_DP] = arr[:, COL_DP] <= 0.0
+        bad[:, COL_SWIRL] = arr[:, COL_SWIRL] < 0.0
+    return bad
+
+
+class MeasureTableModel(QAbstractTableModel):
+    """
+    Editable N×4 measurement table. Text entered in a cell is parsed with parse_float_pl
+    (comma or dot decimals); an empty cell is stored as NaN, unparsable text is rejected.
+
+    sig_edited fires only for user edits (setData), not for programmatic loads, so owners
+    can save back to state without re-entering on set_rows/apply_rows.
+
+    With mark_invalid, cells breaking the save rules (lift/q missing or < 0, dp <= 0,
+    swirl < 0) get a red background and a tooltip naming the rule.
+    """
+
+    COLUMNS = COLUMNS
+    sig_edited = Signal()
+
+    def __init__(
+        self,
+        headers: Sequence[str] = COLUMNS,
+        parent: Optional[QObject] = None,
+        *,
+        header_tips: Sequence[str] = (),
+        mark_invalid: bool = False,
+    ) -> None:
+        super().__init__(parent)
+        self._headers: Tuple[str, ...] = tuple(headers)
+        self._header_tips: Tuple[str, ...] = tuple(header_tips)
+        self._mark_invalid = bool(mark_invalid)
+        self._data: np.ndarray = np.full((0, len(COLUMNS)), np.nan)
+        # invalid_mask of _data, rebuilt lazily after bulk changes; see _bad
+        self._invalid: Optional[np.ndarray] = None
+
+    def cell_ok(self, row: int, col: int) -> bool:
+        """Whether one cell satisfies the rule its column is saved with."""
+        v = self._data[row, col]
+        if col in (COL_LIFT, COL_Q):
+            return bool(v >= 0.0)  # NaN compares False: a missing lift/q is invalid
+        if col == COL_DP:
+            return bool(np.isnan(v) or v > 0.0)
+        return bool(np.isnan(v) or v >= 0.0)
+
+    def _bad(self, row: int, col: int) -> bool:
+        inv = self._invalid
+        if inv is None or inv.shape != self._data.shape:
+            inv = self._invalid = invalid_mask(self._data)
+        return bool(inv[row, col])
+
+    # ---- Qt model interface ----
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else int(self._data.shape[0])
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            v = self._data[index.row(), index.column()]
+            return "" if np.isnan(v) else str(float(v))
+        if role == Qt.TextAlignmentRole:
+            return _ALIGN_NUM
+        if role == MULTIPLE_ROLES:
+            v = self._data[index.row(), index.column()]
+            roles = {
+                Qt.DisplayRole: "" if np.isnan(v) else str(float(v)),
+                Qt.TextAlignmentRole: _ALIGN_NUM,
+            }
+            if self._mark_invalid and self._bad(index.row(), index.column()):
+                roles[Qt.BackgroundRole] = _INVALID_BRUSH
+            return roles
+        if role in (Qt.BackgroundRole, Qt.ToolTipRole) and self._mark_invalid:
+            if not self._bad(index.row(), index.column()):
+                return None
+            return _INVALID_BRUSH if role == Qt.BackgroundRole else _INVALID_TIPS[index.column()]
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        text = "" if value is None else str(value).strip()
+        if text:
+            try:
+                v = parse_float_pl(text)
+            except ValueError:
+                return False
+        else:
+            v = np.nan
+        r, c = index.row(), index.column()
+        was_bad = self._bad(r, c)
+        self._data[r, c] = v
+        bad = not self.cell_ok(r, c)
+        self._invalid[r, c] = bad  # type: ignore[index]
+        roles = [Qt.DisplayRole, Qt.EditRole]
+        if self._mark_invalid and bad != was_bad:
+            roles += [Qt.BackgroundRole, Qt.ToolTipRole]
+        self.dataChanged.emit(index, index, roles)
+        self.sig_edited.emit()
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def headerData(
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole
+    ) -> Any:
+        if orientation == Qt.Horizontal and role == Qt.ToolTipRole:
+            tips = self._header_tips
+            return tips[section] if 0 <= section < len(tips) else None
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section] if 0 <= section < len(self._headers) else None
+        return str(section + 1)
+
+    # ---- Bulk helpers ----
+    def set_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Replace the whole table from state rows (single model reset)."""
+        self.beginResetModel()
+        self._data = rows_to_array(rows)
+        self._invalid = None
+        self.endResetModel()
+
+    def apply_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """
+        Bring the table to `rows` (sorted by lift) touching only the difference: rows whose
+        lift disappeared are removed, new lifts are inserted in place, and matching lifts
+        get a dataChanged only when their cells actually differ.
+        """
+        new = rows_to_array(rows)
+        self._invalid = None
+        keep = set(new[:, COL_LIFT].tolist())
+        # Removals (descending, contiguous runs) for lifts no longer present
+        gone = [i for i, v in enumerate(self._data[:, COL_LIFT].tolist()) if v not in keep]
+        while gone:
+            last = gone.pop()
+            first = last
+            while gone and gone[-1] == first - 1:
+                first = gone.pop()
+            self.beginRemoveRows(QModelIndex(), first, last)
+            self._data = np.delete(self._data, np.s_[first : last + 1], axis=0)
+            self.endRemoveRows()
+        # Merge walk: update matching lifts, insert the missing ones at their position
+        for i in range(new.shape[0]):
+            row = new[i]
+            if i < self._data.shape[0] and self._data[i, COL_LIFT] == row[COL_LIFT]:
+                cur = self._data[i]
+                same = (cur == row) | (np.isnan(cur) & np.isnan(row))
+                if not same.all():
+                    self._data[i] = row
+                    self.dataChanged.emit(self.index(i, 0), self.index(i, len(COLUMNS) - 1))
+                continue
+            self.beginInsertRows(QModelIndex(), i, i)
+            self._data = np.insert(self._data, i, row, axis=0)
+            self.endInsertRows()
+        # Leftovers (duplicates / out-of-order lifts) end up past the new length
+        n = new.shape[0]
+        if self._data.shape[0] > n:
+            self.beginRemoveRows(QModelIndex(), n, self._data.shape[0] - 1)
+            self._data = self._data[:n]
+            self.endRemoveRows()
+        self._invalid = None
+
+    def append_array(self, arr: np.ndarray) -> None:
+        """Append an (K, 4) block of cells with one insert notification."""
+        if arr.shape[0] == 0:
+            return
+        n = self._data.shape[0]
+        self.beginInsertRows(QModelIndex(), n, n + arr.shape[0] - 1)
+        self._data = np.vstack((self._data, arr.astype(np.float64, copy=False)))
+        self._invalid = None
+        self.endInsertRows()
+
+    def to_rows(self) -> List[Dict[str, Any]]:
+        return array_to_rows(self._data)
+
+    @property
+    def array(self) -> np.ndarray:
+        return self._data
+
+
+class PlanTableModel(QAbstractTableModel):
+    """
+    Editable N×2 test-plan table (lift, dp) over a float64 array, NaN for an empty cell.
+    Cells show 3 decimals; entered text is parsed with parse_float_pl and unparsable text
+    is rejected. sig_edited fires only for user edits (setData).
+
+    revision is bumped on every change of the cells, so owners can cache what they
+    derive from the array until the next change.
+    """
+
+    COLUMNS = PLAN_COLUMNS
+    sig_edited = Signal()
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._data: np.ndarray = np.full((0, len(PLAN_COLUMNS)), np.nan)
+        self.revision = 0
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else int(self._data.shape[0])
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else len(PLAN_COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            v = self._data[index.row(), index.column()]
+            return "" if np.isnan(v) else f"{v:.3f}"
+        if role == Qt.TextAlignmentRole:
+            return _ALIGN_NUM
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        text = "" if value is None else str(value).strip()
+        if text:
+            try:
+                v = parse_float_pl(text)
+            except ValueError:
+                return False
+        else:
+            v = np.nan
+        self._data[index.row(), index.column()] = v
+        self.revision += 1
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        self.sig_edited.emit()
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def headerData(
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole
+    ) -> Any:
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return PLAN_COLUMNS[section] if 0 <= section < len(PLAN_COLUMNS) else None
+        return str(section + 1)
+
+    def set_rows(self, lifts: Sequence[float], dps: Sequence[Optional[float]]) -> None:
+        """Replace the table with one row per lift (single model reset); None dp -> empty."""
+        data = np.full((len(lifts), len(PLAN_COLUMNS)), np.nan)
+        data[:, 0] = lifts
+        data[:, 1] = [np.nan if d is None else d for d in dps]
+        self.beginResetModel()
+        self._data = data
+        self.revision += 1
+        self.endResetModel()
+
+    @property
+    def array(self) -> np.ndarray:
+        return self._data
+
+
+class NumericItemDelegate(QStyledItemDelegate):
+    """
+    Delegate whose line-edit editors only accept numeric characters, so typos are rejected
+    per keystroke instead of reaching the model; range rules stay with the table's checks.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._validator = QRegularExpressionValidator(QRegularExpression(_NUM_INPUT_RE), self)
+
+    def createEditor(
+        self, parent: QWidget, option: QStyleOptionViewItem, index: QModelIndex
+    ) -> QWidget:
+        editor = super().createEditor(parent, option, index)
+        if isinstance(editor, QLineEdit):
+            editor.setValidator(self._validator)
+        return editor
+
+
+class MeasureItemDelegate(NumericItemDelegate):
+    """
+    Delegate that fills the style option from a single MULTIPLE_ROLES fetch instead of
+    one data() call per role, keeping the result for recently painted cells (LRU).
+    The cache is dropped on any model change.
+    """
+
+    def __init__(
+        self, model: QAbstractTableModel, parent: Optional[QObject] = None, cache_size: int = 512
+    ) -> None:
+        super().__init__(parent)
+        self._cache: "OrderedDict[Tuple[int, int], Dict[Any, Any]]" = OrderedDict()
+        self._cache_size = int(cache_size)
+        for sig in (model.dataChanged, model.modelReset, model.rowsInserted, model.rowsRemoved):
+            sig.connect(self.clear_cache)
+
+    def clear_cache(self, *_: Any) -> None:
+        self._cache.clear()
+
+    def _roles(self, index: QModelIndex) -> Dict[Any, Any]:
+        key = (index.row(), index.column())
+        roles = self._cache.get(key)
+        if roles is not None:
+            self._cache.move_to_end(key)
+            return roles
+        roles = index.data(MULTIPLE_ROLES) or {}
+        self._cache[key] = roles
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return roles
+
+    def initStyleOption(self, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        roles = self._roles(index)
+        option.index = index
+        option.text = roles.get(Qt.DisplayRole, "")
+        option.displayAlignment = roles.get(Qt.TextAlignmentRole, _ALIGN_NUM)
+        if Qt.BackgroundRole in roles:
+            option.backgroundBrush = roles[Qt.BackgroundRole]
+        option.features |= QStyleOptionViewItem.HasDisplay
+
+
+__all__ = [
+    "COLUMNS",
+    "COL_DP",
+    "COL_LIFT",
+    "COL_Q",
+    "COL_SWIRL",
+    "MULTIPLE_ROLES",
+    "PLAN_COLUMNS",
+    "MeasureColumns",
+    "MeasureItemDelegate",
+    "MeasureTableModel",
+    "NumericItemDelegate",
+    "PlanTableModel",
+    "array_to_rows",
+    "batch_updates",
+    "clean_array",
+    "invalid_mask",
+    "lift_key",
+    "merge_lifts",
+    "parse_rows_array",
+    "parse_rows_array_counted",
+    "round_lifts",
+    "rows_to_array",
+]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field, asdict
+from functools import lru_cache
 from typing import Any, Dict, Literal, Optional, Tuple, List
 
 from iop_flow.schemas import AirConditions, Engine, Geometry
@@ -12,10 +14,32 @@ DisplayUnits = Literal["workshop_pl"]
 Mode = Literal["baseline", "after", "compare"]
 
 
+# Comma -> dot, drop spaces/NBSP (thousand separators) in a single translate pass
+_PL_TRANS = str.maketrans({",": ".", " ": None, "\xa0": None})
+# Plain decimal/scientific number after translation (what float() is sure to accept)
+_NUM_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+
+
+@lru_cache(maxsize=4096)
 def parse_float_pl(text: str) -> float:
-    # Accept Polish comma decimal and ignore spaces (including NBSP) as thousand separators
-    cleaned = text.strip().replace("\xa0", "").replace(" ", "").replace(",", ".")
-    return float(cleaned)
+    # Accept Polish comma decimal and ignore spaces (including NBSP) as thousand separators;
+    # float() already skips surrounding tabs/newlines, so no strip() pass
+    return float(text.translate(_PL_TRANS))
+
+
+@lru_cache(maxsize=4096)
+def try_parse_float_pl(text: str) -> Optional[float]:
+    """parse_float_pl for live input: None for empty/partial/malformed text instead of raising."""
+    t = text.strip().translate(_PL_TRANS)
+    if not t or _NUM_RE.fullmatch(t) is None:
+        return None
+    return float(t)
+
+
+@lru_cache(maxsize=8)
+def air_density_cached(p_tot: float, T: float, RH: float) -> float:
+    """F.air_density for (p_tot [Pa], T [K], RH [0..1]); the air inputs rarely change."""
+    return F.air_density(F.AirState(p_tot, T, RH))
 
 
 # Unit conversion helpers (workshop-friendly units)
@@ -484,7 +508,18 @@ def parse_rows(text: str) -> List[Tuple[float, float, Optional[float], Optional[
     - 4 cols: lift_mm, q_cfm, dp_inH2O, swirl_rpm
     Skip empty lines; validate: lift>=0, q>=0, dp>0(if given), swirl>=0(if given).
     """
+    return parse_rows_counted(text)[0]
+
+
+def parse_rows_counted(
+    text: str,
+) -> Tuple[List[Tuple[float, float, Optional[float], Optional[float]]], int]:
+    """
+    parse_rows plus the number of rejected rows (lines with >= 2 fields that failed to
+    parse or validate), counted in the same pass. Lines with < 2 fields are not counted.
+    """
     out: List[Tuple[float, float, Optional[float], Optional[float]]] = []
+    bad = 0
     for raw in text.splitlines():
         line = raw.strip()
         if not line:
@@ -507,15 +542,18 @@ def parse_rows(text: str) -> List[Tuple[float, float, Optional[float], Optional[
             dp = parse_float_pl(parts[2]) if len(parts) >= 3 and parts[2].strip() != "" else None
             swirl = parse_float_pl(parts[3]) if len(parts) >= 4 and parts[3].strip() != "" else None
         except Exception:
+            bad += 1
             continue
-        if lift < 0 or q < 0:
-            continue
-        if dp is not None and dp <= 0:
-            continue
-        if swirl is not None and swirl < 0:
+        if (
+            lift < 0
+            or q < 0
+            or (dp is not None and dp <= 0)
+            or (swirl is not None and swirl < 0)
+        ):
+            bad += 1
             continue
         out.append((round(lift, 3), q, dp, swirl))
-    return out
+    return out, bad
 
 
 def set_geometry_from_ui(
@@ -15,7 +15,7 @@ from PySide6.QtWidgets import (
 from iop_flow import formulas as F
 from iop_flow.schemas import AirConditions
 
-from .state import WizardState, parse_float_pl, is_valid_step_bench
+from .state import WizardState, air_density_cached, parse_float_pl, is_valid_step_bench
 
 
 class StepBench(QWidget):
@@ -96,7 +96,7 @@ class StepBench(QWidget):
             rh = -1.0
 
         if p_pa > 0 and T_K > 0 and 0.0 <= rh <= 1.0:
-            rho = F.air_density(F.AirState(p_pa, T_K, rh))
+            rho = air_density_cached(p_pa, T_K, rh)
             a = F.speed_of_sound(T_K)
             self.lbl_rho.setText(f"ρ: {rho:.4f} kg/m³")
             self.lbl_a.setText(f"a(T): {a:.2f} m/s")
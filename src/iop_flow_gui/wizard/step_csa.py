@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 from PySide6.QtCore import QTimer, Signal
 from PySide6.QtWidgets import (
     QWidget,
@@ -203,9 +204,11 @@ class StepCSA(QWidget):
                 except Exception:
                     a_T = 0.0
                 title = f"Mach@min-CSA min-CSA={min_csa_mm2:.0f} mm²; a(T)={a_T:.0f} m/s"
-                lifts_mm = [float(v or 0.0) * 1000.0 for v in lifts]
+                # float64 arrays (None -> NaN gap) so matplotlib skips its object-dtype path
+                lifts_mm = np.array([v or 0.0 for v in lifts], dtype=np.float64) * 1000.0
+                mach_a = np.array(mach, dtype=np.float64)
                 self.plot_mach.set_readout_units("mm", "-")
-                self.plot_mach.plot_xy(lifts_mm, mach, label="Mach@minCSA", xlabel="Lift [mm]", ylabel="Mach (-)", title=title)
+                self.plot_mach.plot_xy(lifts_mm, mach_a, label="Mach@minCSA", xlabel="Lift [mm]", ylabel="Mach (-)", title=title)
         self.plot_mach.render()
         rpm_flow = engine.get("rpm_flow_limit")
         rpm_csa = engine.get("rpm_from_csa")
@@ -6,18 +6,27 @@ public attributes used by tests.
 
 from __future__ import annotations
 
+import math
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Tuple
 
-from PySide6.QtCore import QTimer, Signal, QEvent
-from PySide6.QtGui import QKeyEvent, QKeySequence
+import numpy as np
+from PySide6.QtCore import (
+    QEvent,
+    QRegularExpression,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import QKeyEvent, QKeySequence, QRegularExpressionValidator
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QPushButton,
     QLabel,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
+    QHeaderView,
     QMessageBox,
     QGroupBox,
     QLineEdit,
@@ -27,14 +36,79 @@ from PySide6.QtWidgets import (
     QAbstractItemView,
 )
 
-from iop_flow.api import run_all
 from iop_flow import formulas as F
+from iop_flow.schemas import Session
+from iop_flow.tuning import (
+    collector_csa_from_q,
+    exhaust_quarter_wave_L_phys,
+    exhaust_quarter_wave_rpm_for_L,
+)
 
 try:  # allow import when loaded via spec_from_file_location in tests
-    from .state import WizardState, parse_rows  # type: ignore[relative-beyond-top-level]
+    from .state import (  # type: ignore[relative-beyond-top-level]
+        WizardState,
+        parse_float_pl,
+    )
+    from .measure_model import (  # type: ignore[relative-beyond-top-level]
+        MeasureColumns,
+        MeasureItemDelegate,
+        MeasureTableModel,
+        batch_updates,
+        clean_array,
+        merge_lifts,
+        parse_rows_array,
+    )
+    from .compute_task import RunAllTask  # type: ignore[relative-beyond-top-level]
 except Exception:  # pragma: no cover
-    from iop_flow_gui.wizard.state import WizardState, parse_rows  # type: ignore[no-redef]
-from iop_flow_gui.widgets.mpl_canvas import MplCanvas
+    from iop_flow_gui.wizard.state import (  # type: ignore[no-redef]
+        WizardState,
+        parse_float_pl,
+    )
+    from iop_flow_gui.wizard.measure_model import (  # type: ignore[no-redef]
+        MeasureColumns,
+        MeasureItemDelegate,
+        MeasureTableModel,
+        batch_updates,
+        clean_array,
+        merge_lifts,
+        parse_rows_array,
+    )
+    from iop_flow_gui.wizard.compute_task import RunAllTask  # type: ignore[no-redef]
+
+
+# Bound once at import: used on every tuning/CSA tick
+_M3S_TO_CFM = F.M3S_TO_CFM
+_CFM_TO_M3S = F.CFM_TO_M3S
+_PI = math.pi
+_sqrt = math.sqrt
+
+# Non-negative decimal with either ',' or '.' separator (empty = use default)
+_DECIMAL_RE = r"^(?:\d+(?:[.,]\d*)?)?$"
+_get_q_ref = itemgetter("q_m3s_ref")
+
+
+def _q_peak_m3s(rows: List[Dict[str, Any]]) -> float:
+    """Peak q_m3s_ref over run_all series rows (0.0 when empty)."""
+    return max((float(v) for v in map(_get_q_ref, rows) if v is not None), default=0.0)
+
+
+def _q_peak_from_columns(cols: MeasureColumns, dp_ref_inH2O: float) -> float:
+    """
+    Peak referenced flow [m³/s] straight from measured columns, as run_all normalizes it
+    with the same air for measurement and reference: Q* = Q·sqrt(dp*/dp), dp defaults to dp*.
+    """
+    q = cols.q_cfm
+    ok = ~np.isnan(q)
+    if not ok.any():
+        return 0.0
+    dp = cols.dp_inH2O[ok]
+    dp = np.where(np.isnan(dp) | (dp <= 0.0), dp_ref_inH2O, dp)
+    q_ref = np.maximum(q[ok], 0.0) * _CFM_TO_M3S * np.sqrt(dp_ref_inH2O / dp)
+    return float(q_ref.max())
+
+
+def _q_peak_from_rows(rows: List[Dict[str, Any]], dp_ref_inH2O: float) -> float:
+    return _q_peak_from_columns(MeasureColumns.from_rows(rows), dp_ref_inH2O)
 
 
 class StepExhaust(QWidget):
@@ -44,6 +118,23 @@ class StepExhaust(QWidget):
         super().__init__()
         self.state = state
         self._auto_done = False
+        # Peak exhaust q_m3s_ref from the last run_all; None until computed or after edits
+        self._q_exh_peak: Optional[float] = None
+        # Saved exhaust rows in column form (state keeps the list-of-dict rows)
+        self._cols = MeasureColumns.from_rows(state.measure_exhaust)
+        # Session built from state, reused until the data is marked dirty
+        self._session_cache: Optional[Session] = None
+        self._session_dirty = True
+        # Inputs of the last successful _compute; identical inputs skip the redraw
+        self._last_compute_key: Optional[Tuple[Any, ...]] = None
+        # run_all results keyed by (input fingerprint, run_all kwargs); cleared on edits
+        self._run_all_cache: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+        # Background E/I compute: one task at a time, a request while busy reruns after it
+        self._busy = False
+        self._compute_pending = False
+        self._task: Optional[RunAllTask] = None
+        # Content hash of the last drawn E/I curve (None = nothing drawn / must redraw)
+        self._last_ei_hash: Optional[int] = None
 
         root = QHBoxLayout(self)
         left = QVBoxLayout()
@@ -59,10 +150,15 @@ class StepExhaust(QWidget):
         btns.addStretch(1)
         left.addLayout(btns)
 
-        # Table
-        self.table = QTableWidget(self)
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["lift_mm", "q_cfm", "dp_inH2O", "swirl_rpm"])
+        # Table (view over a NumPy-backed model)
+        self.model = MeasureTableModel(parent=self)
+        self.table = QTableView(self)
+        self.table.setModel(self.model)
+        self.table.setItemDelegate(MeasureItemDelegate(self.model, self.table))
+        # Fixed row heights: the view lays out only visible rows, no per-row size hints
+        vh = self.table.verticalHeader()
+        vh.setSectionResizeMode(QHeaderView.Fixed)
+        vh.setDefaultSectionSize(self.table.fontMetrics().height() + 8)
         self.table.setEditTriggers(QAbstractItemView.AllEditTriggers)
         self.table.setSelectionBehavior(QAbstractItemView.SelectItems)
         self.table.setSelectionMode(QAbstractItemView.ContiguousSelection)
@@ -157,27 +253,9 @@ class StepExhaust(QWidget):
         tuning_lay.addWidget(self.lbl_tuning_status)
         tuning_lay.addWidget(self.lbl_corner_notice)
 
-        # Primary length helper
-        helper = QGroupBox("Długość primary (1D)", self)
-        helper.setToolTip("Szacunek z modelu ćwierćfali")
-        hl = QHBoxLayout(helper)
-        self.ed_phi_exh = QLineEdit(self)
-        self.ed_phi_exh.setPlaceholderText("phi [deg]")
-        self.ed_phi_exh.setText("90")
-        self.ed_harm_exh = QLineEdit(self)
-        self.ed_harm_exh.setPlaceholderText("harm")
-        self.ed_harm_exh.setText("1")
-        self.ed_rpm_exh = QLineEdit(self)
-        self.ed_rpm_exh.setPlaceholderText("RPM cel")
-        if self.state.engine_target_rpm:
-            self.ed_rpm_exh.setText(str(self.state.engine_target_rpm))
-        self.lbl_len_exh = QLabel("L ≈ — mm; a_exh(T)=— m/s; harm=—", self)
-        for lab, w in (("phi:", self.ed_phi_exh), ("harm:", self.ed_harm_exh), ("RPM:", self.ed_rpm_exh)):
-            hl.addWidget(QLabel(lab, self))
-            hl.addWidget(w)
-        hl.addWidget(self.lbl_len_exh)
-        hl.addStretch(1)
-        tuning_lay.addWidget(helper)
+        # Primary length helper and CSA box are built on first show (_build_lazy_boxes)
+        self._tuning_lay = tuning_lay
+        self._lazy_built = False
 
         # Actions
         actions = QHBoxLayout()
@@ -189,8 +267,16 @@ class StepExhaust(QWidget):
         # Right column
         right = QVBoxLayout()
         root.addLayout(right, 3)
+        # Deferred: matplotlib is only needed once the step is actually built
+        from iop_flow_gui.widgets.mpl_canvas import MplCanvas
+
         self.plot_ei = MplCanvas()
         self.plot_ei.set_readout_units("mm", "-")
+        # Coalesce redraws: bursts of updates paint once, 30 ms after the last one
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(30)
+        self._render_timer.timeout.connect(self.plot_ei.render)
         right.addWidget(self.plot_ei)
         self.lbl_ei = QLabel("—", self)
         self.lbl_alert = QLabel("", self)
@@ -199,11 +285,75 @@ class StepExhaust(QWidget):
         self.lbl_corner.setStyleSheet("color:#666;font-style:italic;")
         for w in (self.lbl_ei, self.lbl_alert, self.lbl_corner):
             right.addWidget(w)
+        self._right_lay = right
+        # Coalesce bursts of cell edits into one save to state
+        self._save_timer = QTimer(self)
+        self._save_timer.setInterval(150)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self._do_save)
+
+        # Wiring
+        # Per-keystroke inputs: bound-method slots, no lambda frame per signal
+        for spn in (self.spn_L_mm, self.spn_D_mm, self.spn_T_exh_K, self.spn_v_target):
+            spn.valueChanged.connect(self._recompute_tuning)
+        self.cmb_n_harm.currentIndexChanged.connect(self._recompute_tuning)
+        self.btn_compute.clicked.connect(lambda *_: self._compute())
+        self.btn_autofill.clicked.connect(self._autofill)
+        self.btn_copy_from_int.clicked.connect(self._copy_intake_lifts)
+        self.btn_clear.clicked.connect(self._clear)
+        self.model.sig_edited.connect(self._on_changed)
+
+        # Initial populate
+        self._load_from_state()
+        self._update_counts()
+        self._emit_valid()
+        self._recompute_tuning()
+        QTimer.singleShot(0, self._auto_compute_once)
+
+    def _build_lazy_boxes(self) -> None:
+        # Primary-length and CSA helpers: only needed once the step is actually shown
+        self._lazy_built = True
+        # Primary length helper
+        helper = QGroupBox("Długość primary (1D)", self)
+        helper.setToolTip("Szacunek z modelu ćwierćfali")
+        hl = QHBoxLayout(helper)
+        self.ed_phi_exh = QLineEdit(self)
+        self.ed_phi_exh.setPlaceholderText("phi [deg]")
+        self.ed_phi_exh.setText("90")
+        self.ed_harm_exh = QLineEdit(self)
+        self.ed_harm_exh.setPlaceholderText("harm")
+        self.ed_harm_exh.setText("1")
+        self.ed_rpm_exh = QLineEdit(self)
+        self.ed_rpm_exh.setPlaceholderText("RPM cel")
+        if self.state.engine_target_rpm:
+            self.ed_rpm_exh.setText(str(self.state.engine_target_rpm))
+        self.lbl_len_exh = QLabel("L ≈ — mm; a_exh(T)=— m/s; harm=—", self)
+        # Validators reject malformed text up front so slots only check hasAcceptableInput()
+        self.ed_phi_exh.setValidator(
+            QRegularExpressionValidator(QRegularExpression(_DECIMAL_RE), self.ed_phi_exh)
+        )
+        self.ed_harm_exh.setValidator(
+            QRegularExpressionValidator(QRegularExpression(r"^[1-9]?$"), self.ed_harm_exh)
+        )
+        self.ed_rpm_exh.setValidator(
+            QRegularExpressionValidator(QRegularExpression(_DECIMAL_RE), self.ed_rpm_exh)
+        )
+        for lab, w in (("phi:", self.ed_phi_exh), ("harm:", self.ed_harm_exh), ("RPM:", self.ed_rpm_exh)):
+            hl.addWidget(QLabel(lab, self))
+            hl.addWidget(w)
+        hl.addWidget(self.lbl_len_exh)
+        hl.addStretch(1)
+        self._tuning_lay.addWidget(helper)
+
+        # Collector CSA
         csa_box = QGroupBox("Primary/Collector CSA", self)
         csa_l = QHBoxLayout(csa_box)
         self.ed_v_exh = QLineEdit(self)
         self.ed_v_exh.setPlaceholderText("v_target [m/s]")
         self.ed_v_exh.setText("70")
+        self.ed_v_exh.setValidator(
+            QRegularExpressionValidator(QRegularExpression(_DECIMAL_RE), self.ed_v_exh)
+        )
         self.lbl_A_req = QLabel("A_req = — mm²", self)
         self.lbl_d_eq2 = QLabel("d_eq = — mm", self)
         csa_l.addWidget(QLabel("v_target:", self))
@@ -211,35 +361,29 @@ class StepExhaust(QWidget):
         csa_l.addWidget(self.lbl_A_req)
         csa_l.addWidget(self.lbl_d_eq2)
         csa_l.addStretch(1)
-        right.addWidget(csa_box)
+        self._right_lay.addWidget(csa_box)
 
-        # Wiring
-        for spn in (self.spn_L_mm, self.spn_D_mm, self.spn_T_exh_K, self.spn_v_target):
-            spn.valueChanged.connect(lambda *_: self._recompute_tuning())
-        self.cmb_n_harm.currentIndexChanged.connect(lambda *_: self._recompute_tuning())
         for ed in (self.ed_phi_exh, self.ed_harm_exh, self.ed_rpm_exh):
-            ed.textChanged.connect(lambda *_: self._compute_primary_length())
+            ed.textChanged.connect(self._compute_primary_length)
         self.ed_v_exh.textChanged.connect(lambda *_: self._update_csa_numbers())
-        self.btn_compute.clicked.connect(lambda *_: self._compute())
-        self.btn_autofill.clicked.connect(self._autofill)
-        self.btn_copy_from_int.clicked.connect(self._copy_intake_lifts)
-        self.btn_clear.clicked.connect(self._clear)
-        self.table.itemChanged.connect(self._on_changed)
-
-        # Initial populate
-        self._load_from_state()
-        self._update_counts()
-        self._emit_valid()
-        self._recompute_tuning()
         self._compute_primary_length()
         self._update_csa_numbers()
-        QTimer.singleShot(0, self._auto_compute_once)
 
     # ---- Auto compute pattern ----
     def showEvent(self, event):  # type: ignore[override]
+        # Earlier steps may have changed air/engine/geometry while we were hidden
+        self._mark_dirty()
+        self._cols = MeasureColumns.from_rows(self.state.measure_exhaust)
+        if not self._lazy_built:
+            self._build_lazy_boxes()
         super().showEvent(event)
         self._auto_compute_once()
 
+    def hideEvent(self, event):  # type: ignore[override]
+        # Leaving the step: make sure pending edits reach the state
+        self._flush_pending_save()
+        super().hideEvent(event)
+
     def _auto_compute_once(self) -> None:
         if self._auto_done:
             return
@@ -250,14 +394,56 @@ class StepExhaust(QWidget):
             pass
         self.sig_valid_changed.emit(True)
 
-    # ---- Internal tuning helpers ----
-    def _recompute_tuning(self) -> None:  # noqa: C901
-        from iop_flow.tuning import (
-            exhaust_quarter_wave_rpm_for_L,
-            exhaust_quarter_wave_L_phys,
-            collector_csa_from_q,
-        )
+    def _mark_dirty(self) -> None:
+        self._session_dirty = True
+        self._q_exh_peak = None
+        self._run_all_cache.clear()
+
+    def _get_session(self) -> Session:
+        if self._session_dirty or self._session_cache is None:
+            self._session_cache = self.state.build_session_for_run_all()
+            self._session_dirty = False
+        return self._session_cache
+
+    def _run_all_args(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "dp_ref_inH2O": self.state.air_dp_ref_inH2O or 28.0,
+            "engine_v_target": (self.state.engine_target_rpm or 100.0),
+            "a_ref_mode": "eff",
+            "eff_mode": "smoothmin",
+            **kwargs,
+        }
+
+    def _run_all_cache_key(
+        self, key: Optional[Tuple[Any, ...]], kwargs: Dict[str, Any]
+    ) -> Optional[Tuple[Any, ...]]:
+        # Keyed on the arguments run_all actually gets, not the caller's spelling of them
+        if key is None:
+            return None
+        return (key, tuple(sorted(self._run_all_args(kwargs).items())))
+
+    def _compute_key(self) -> Optional[Tuple[Any, ...]]:
+        s = self.state
+        try:
+            key = (
+                tuple(tuple(sorted(r.items())) for r in s.measure_intake),
+                tuple(tuple(sorted(r.items())) for r in s.measure_exhaust),
+                s.air,
+                s.engine,
+                s.geometry,
+                s.csa_min_m2,
+                s.csa_avg_m2,
+                s.air_dp_ref_inH2O,
+                s.engine_target_rpm,
+                s.meta.get("mode"),
+            )
+            hash(key)
+        except TypeError:  # pragma: no cover - unhashable row values
+            return None
+        return key
 
+    # ---- Internal tuning helpers ----
+    def _recompute_tuning(self, *_: Any) -> None:  # noqa: C901
         L_mm = float(self.spn_L_mm.value())
         D_mm = float(self.spn_D_mm.value())
         n_harm = int(self.cmb_n_harm.currentText())
@@ -286,7 +472,7 @@ class StepExhaust(QWidget):
             try:
                 csa_m2, csa_mm2_val = collector_csa_from_q(q_peak, v_target)
                 csa_mm2 = csa_mm2_val
-                d_eq_mm = (4.0 * csa_m2 / 3.141592653589793) ** 0.5 * 1000.0
+                d_eq_mm = _sqrt(4.0 * csa_m2 / _PI) * 1000.0
             except Exception:  # pragma: no cover
                 pass
         elif notice == "":
@@ -300,7 +486,7 @@ class StepExhaust(QWidget):
             a_exh = F.speed_of_sound(T_exh)
         except Exception:  # pragma: no cover
             a_exh = None
-        q_cfm = F.m3s_to_cfm(q_peak) if q_peak > 0 else None
+        q_cfm = q_peak * _M3S_TO_CFM if q_peak > 0 else None
         if a_exh and q_cfm is not None:
             self.lbl_tuning_status.setText(
                 "a_exh(T)="
@@ -335,56 +521,38 @@ class StepExhaust(QWidget):
         self.state.tuning["exhaust_calc"] = d
 
     def _estimate_q_peaks(self) -> Tuple[float, str]:
+        # Q*_peak straight from the measured rows, like _update_csa_numbers: the tuning
+        # panel never waits for run_all on the GUI thread
+        dp_ref = self.state.air_dp_ref_inH2O or 28.0
         try:
-            session = self.state.build_session_for_run_all()
-            result = run_all(
-                session,
-                dp_ref_inH2O=self.state.air_dp_ref_inH2O or 28.0,
-                engine_v_target=(self.state.engine_target_rpm or 100.0),
-            )
-            ex = (result.get("series", {}).get("exhaust", []) or [])  # type: ignore[index]
-            if ex:
-                return max(float(r.get("q_m3s_ref") or 0.0) for r in ex), ""
-            intake = (result.get("series", {}).get("intake", []) or [])  # type: ignore[index]
-            if intake:
-                q_int = max(float(r.get("q_m3s_ref") or 0.0) for r in intake)
+            if self._q_exh_peak is None:
+                self._q_exh_peak = _q_peak_from_columns(self._cols, dp_ref)
+            if self._q_exh_peak > 0.0:
+                return self._q_exh_peak, ""
+            q_int = _q_peak_from_rows(self.state.measure_intake, dp_ref)
+            if q_int > 0.0:
                 return 0.78 * q_int, "Brak danych EXH – użyto szacunku 0.78×INT"
         except Exception:  # pragma: no cover
             pass
-        try:
-            meas_exh = [
-                float(r.get("q_cfm"))
-                for r in self.state.measure_exhaust
-                if r.get("q_cfm") is not None
-            ]
-            if meas_exh:
-                q_exh = max(F.cfm_to_m3s(q) for q in meas_exh)  # type: ignore[attr-defined]
-                return q_exh, "Szacunek z tabeli EXH (bez korekcji)"
-            meas_int = [
-                float(r.get("q_cfm"))
-                for r in self.state.measure_intake
-                if r.get("q_cfm") is not None
-            ]
-            if meas_int:
-                q_int = max(F.cfm_to_m3s(q) for q in meas_int)  # type: ignore[attr-defined]
-                return 0.78 * q_int, "Brak danych EXH – użyto 0.78×INT (tabela)"
-        except Exception:  # pragma: no cover
-            pass
         return 0.0, "Brak danych INT/EXH — CSA pominięte"
 
-    def _compute_primary_length(self) -> None:
+    def _compute_primary_length(self, *_: Any) -> None:
+        if not self._lazy_built:
+            return
+        if not all(
+            ed.hasAcceptableInput() for ed in (self.ed_phi_exh, self.ed_harm_exh, self.ed_rpm_exh)
+        ):
+            self.lbl_len_exh.setText("L ≈ — mm; a_exh(T)=— m/s; harm=—")
+            return
         try:
-            from iop_flow.formulas import primary_length_exhaust_quarterwave
-
-            phi = float((self.ed_phi_exh.text() or "90").replace(",", "."))
-            harm = int(float((self.ed_harm_exh.text() or "1").replace(",", ".")))
-            rpm = float(
-                (self.ed_rpm_exh.text() or str(self.state.engine_target_rpm or 6500)).replace(",", ".")
-            )
+            phi = parse_float_pl(self.ed_phi_exh.text() or "90")
+            harm = int(parse_float_pl(self.ed_harm_exh.text() or "1"))
+            rpm_txt = self.ed_rpm_exh.text() or str(self.state.engine_target_rpm or 6500)
+            rpm = parse_float_pl(rpm_txt)
             # Use exhaust gas temperature for a(T)
             T_exh = float((self.spn_T_exh_K.value() if hasattr(self, "spn_T_exh_K") else 700.0))
             a_T = F.speed_of_sound(T_exh)
-            L_m = primary_length_exhaust_quarterwave(rpm, T_exh, phi_deg=phi, harmonic=harm)
+            L_m = F.primary_length_exhaust_quarterwave(rpm, T_exh, phi_deg=phi, harmonic=harm)
             self.lbl_len_exh.setText(f"L ≈ {L_m*1000:.0f} mm; a_exh(T)={a_T:.0f} m/s; harm={harm}")
         except Exception:  # pragma: no cover
             self.lbl_len_exh.setText("L ≈ — mm; a_exh(T)=— m/s; harm=—")
@@ -399,155 +567,160 @@ class StepExhaust(QWidget):
         return super().eventFilter(obj, event)
 
     def _load_from_state(self) -> None:
-        rows = self.state.measure_exhaust
-        self.table.blockSignals(True)
-        self.table.setRowCount(len(rows))
-        for r, row in enumerate(rows):
-            for c, key in enumerate(["lift_mm", "q_cfm", "dp_inH2O", "swirl_rpm"]):
-                val = row.get(key)
-                self.table.setItem(r, c, QTableWidgetItem("" if val is None else str(val)))
-        self.table.blockSignals(False)
+        self._last_ei_hash = None
+        self._cols = MeasureColumns.from_rows(self.state.measure_exhaust)
+        with batch_updates(self.table):
+            self.model.set_rows(self.state.measure_exhaust)
+
+    def _apply_rows(self, rows: List[Dict[str, Any]]) -> None:
+        # Diff-update the table instead of rebuilding it from state
+        self._save_timer.stop()
+        self.state.measure_exhaust = rows
+        self._cols = MeasureColumns.from_rows(rows)
+        self._mark_dirty()
+        with batch_updates(self.table):
+            self.model.apply_rows(rows)
+        self._update_counts()
+        self._emit_valid()
 
     def _save_to_state(self) -> None:
-        def parse_item(it: Optional[QTableWidgetItem]) -> Optional[float]:
-            if it is None:
-                return None
-            s = (it.text() or "").strip()
-            if not s:
-                return None
-            try:
-                from .state import parse_float_pl
-
-                return parse_float_pl(s)
-            except Exception:  # pragma: no cover
-                return None
-
-        rows: List[Dict[str, Any]] = []
-        seen: Dict[float, int] = {}
-        for r in range(self.table.rowCount()):
-            lift = parse_item(self.table.item(r, 0))
-            q = parse_item(self.table.item(r, 1))
-            dp = parse_item(self.table.item(r, 2))
-            swirl = parse_item(self.table.item(r, 3))
-            if lift is None or q is None:
-                continue
-            lift = round(max(lift, 0.0), 3)
-            row: Dict[str, Any] = {"lift_mm": lift, "q_cfm": max(q, 0.0)}
-            if dp is not None and dp > 0:
-                row["dp_inH2O"] = dp
-            if swirl is not None and swirl >= 0:
-                row["swirl_rpm"] = swirl
-            if lift in seen:
-                rows[seen[lift]] = row
-            else:
-                seen[lift] = len(rows)
-                rows.append(row)
-        rows.sort(key=lambda x: x["lift_mm"])  # type: ignore[index]
-        self.state.measure_exhaust = rows
+        # Dedup by lift (last wins), clamping and sort are vectorized on the cell array;
+        # the columns stay with the step, the state gets plain rows
+        self._cols = MeasureColumns.from_array(clean_array(self.model.array))
+        self.state.measure_exhaust = self._cols.to_rows()
 
     def _update_counts(self) -> None:
-        rows = self.state.measure_exhaust
-        n = len(rows)
-        m = sum(1 for r in rows if r.get("dp_inH2O") is not None)
-        k = sum(1 for r in rows if r.get("swirl_rpm") is not None)
+        cols = self._cols
+        n, m, k = len(cols), cols.count_dp(), cols.count_swirl()
         self.lbl_counts.setText(f"n: {n}, z dp: {m}, ze swirl: {k}")
 
     def _on_changed(self, *_: Any) -> None:
+        self._save_timer.start()
+
+    def _do_save(self) -> None:
         self._save_to_state()
+        self._mark_dirty()
         self._update_counts()
         self._emit_valid()
 
+    def _flush_pending_save(self) -> None:
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._do_save()
+
     def _paste_from_clipboard(self) -> None:
-        txt = QApplication.clipboard().text()
-        rows = parse_rows(txt or "")
-        if not rows:
+        block = parse_rows_array(QApplication.clipboard().text() or "")
+        if block.shape[0] == 0:
             return
-        start = self.table.rowCount()
-        self.table.setRowCount(start + len(rows))
-        for i, (lift, q, dp, swirl) in enumerate(rows):
-            r = start + i
-            vals = [lift, q, dp if dp is not None else "", swirl if swirl is not None else ""]
-            for c, v in enumerate(vals):
-                self.table.setItem(r, c, QTableWidgetItem(str(v)))
+        with batch_updates(self.table):
+            self.model.append_array(block)
+        # One save for the whole pasted block
         self._on_changed()
 
     def _autofill(self) -> None:
+        self._flush_pending_save()
         plan = list(self.state.plan_exhaust())
         if not plan:
             QMessageBox.information(self, "Plan EXH", "Brak planu dla EXH.")
             return
-        rows_map: Dict[float, Dict[str, Any]] = {
-            (row.get("lift_mm") or 0.0): dict(row) for row in self.state.measure_exhaust
-        }
-        for lift in plan:
-            if lift not in rows_map:
-                rows_map[lift] = {"lift_mm": lift}
-        self.state.measure_exhaust = [rows_map[k] for k in sorted(rows_map.keys())]
-        self._load_from_state()
-        self._update_counts()
-        self._emit_valid()
+        # Existing rows are already deduped/sorted by lift; only add the plan lifts missing
+        existing = self.state.measure_exhaust
+        rows = merge_lifts(existing, plan)
+        if rows is not existing:
+            self._apply_rows(rows)
 
     def _copy_intake_lifts(self) -> None:
         lifts = sorted({round(float(r.get("lift_mm", 0.0)), 3) for r in self.state.measure_intake})
-        self.state.measure_exhaust = [{"lift_mm": v} for v in lifts]
-        self._load_from_state()
-        self._update_counts()
-        self._emit_valid()
+        self._apply_rows([{"lift_mm": v} for v in lifts])
 
     def _clear(self) -> None:
-        self.state.measure_exhaust = []
-        self._load_from_state()
-        self._update_counts()
-        self._emit_valid()
+        self._last_ei_hash = None
+        self._apply_rows([])
 
     def _emit_valid(self) -> None:
         self.sig_valid_changed.emit(True)
 
-    def _compute(self) -> None:  # noqa: C901
+    def _compute(self) -> None:
+        self._flush_pending_save()
+        key = self._compute_key()
+        if key is not None and key == self._last_compute_key:
+            return
+        if self._busy:
+            self._compute_pending = True
+            return
         try:
-            session = self.state.build_session_for_run_all()
+            session = self._get_session()
         except Exception:  # pragma: no cover
             return
-        result = run_all(
-            session,
-            dp_ref_inH2O=self.state.air_dp_ref_inH2O or 28.0,
-            a_ref_mode="eff",
-            eff_mode="smoothmin",
-            engine_v_target=(self.state.engine_target_rpm or 100.0),
-        )
+        kwargs: Dict[str, Any] = {}
+        ck = self._run_all_cache_key(key, kwargs)
+        if ck is not None and ck in self._run_all_cache:
+            self._apply_result(self._run_all_cache[ck], key)
+            return
+        # run_all off the GUI thread; _on_run_all_finished applies the result
+        self._busy = True
+        self.btn_compute.setEnabled(False)
+        task = RunAllTask(session, self._run_all_args(kwargs), (key, ck))
+        task.signals.finished.connect(self._on_run_all_finished)
+        self._task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_run_all_finished(self, token: Any, result: Any) -> None:
+        key, ck = token
+        self._busy = False
+        self._task = None
+        self.btn_compute.setEnabled(True)
+        if isinstance(result, Exception):
+            self.lbl_ei.setText(f"Błąd obliczeń: {result}")
+        else:
+            if ck is not None:
+                self._run_all_cache[ck] = result
+            self._apply_result(result, key)
+        if self._compute_pending:
+            self._compute_pending = False
+            self._compute()
+
+    def _apply_result(  # noqa: C901
+        self, result: Dict[str, Any], key: Optional[Tuple[Any, ...]]
+    ) -> None:
         series = result.get("series", {})
         intake: List[Dict[str, Any]] = series.get("intake", [])  # type: ignore[assignment]
         exhaust: List[Dict[str, Any]] = series.get("exhaust", [])  # type: ignore[assignment]
         ei = series.get("ei", [])
-        self.plot_ei.clear()
-        if ei:
-            lifts_m = [float(row.get("lift_m") or 0.0) for row in ei]
-            lifts_mm = [v * 1000.0 for v in lifts_m]
-            vals = [row.get("EI") for row in ei]
-            valid_vals = [float(v) for v in vals if v is not None]
-            title_extra = f" · mean={sum(valid_vals)/len(valid_vals):.3f}" if valid_vals else ""
-            if lifts_mm and any(v is not None for v in vals):
-                self.plot_ei.plot_xy(
+        # Lifts and E/I values (NaN where missing) as arrays; stats are vectorized
+        n = len(ei)
+        lifts_mm = (
+            np.fromiter((r.get("lift_m") or 0.0 for r in ei), dtype=np.float64, count=n) * 1000.0
+        )
+        vals = np.fromiter(
+            (np.nan if r.get("EI") is None else r["EI"] for r in ei), dtype=np.float64, count=n
+        )
+        mask = ~np.isnan(vals)
+        avg: Optional[float] = float(np.nanmean(vals)) if mask.any() else None
+        y = np.where(mask, vals, 0.0)
+        h = hash((lifts_mm.tobytes(), y.tobytes())) if avg is not None else 0
+        if h != self._last_ei_hash:
+            if avg is not None:
+                # Reuse the E/I line across recomputes; only data and title change
+                self.plot_ei.update_line(
                     lifts_mm,
-                    [float(v) if v is not None else 0.0 for v in vals],
+                    y,
                     label="E/I",
                     xlabel="Lift [mm]",
                     ylabel="E/I [–]",
-                    title=f"E/I vs Lift{title_extra}",
+                    title=f"E/I vs Lift · mean={avg:.3f}",
                 )
-        self.plot_ei.render()
+            else:
+                self.plot_ei.clear()
+            self._render_timer.start()
+            self._last_ei_hash = h
         if intake and exhaust:
-            txt = f"INT={len(intake)} EXH={len(exhaust)} dopasowane={len(ei)}"
-            if ei:
-                valid = [x.get("EI") for x in ei if x.get("EI") is not None]
-                if valid:
-                    avg = sum(valid) / len(valid)
-                    txt += f"; mean(E/I)={avg:.3f}"
-                    self.lbl_alert.setText(
-                        "ALERT: E/I poza zakresem 0.70–0.85"
-                        if (avg < 0.70 or avg > 0.85)
-                        else ""
-                    )
+            txt = f"INT={len(intake)} EXH={len(exhaust)} dopasowane={n}"
+            if avg is not None:
+                txt += f"; mean(E/I)={avg:.3f}"
+                self.lbl_alert.setText(
+                    "" if 0.70 <= avg <= 0.85 else "ALERT: E/I poza zakresem 0.70–0.85"
+                )
             self.lbl_corner.setText("")
         else:
             txt = "Brak danych exhaust — E/I będzie puste"
@@ -557,40 +730,36 @@ class StepExhaust(QWidget):
             )
         self.lbl_ei.setText(txt)
         self._update_csa_numbers(result)
-        self._update_primary_length()
+        self._compute_primary_length()
+        self._last_compute_key = key
 
     def _update_csa_numbers(self, result: Optional[Dict[str, Any]] = None) -> None:
-        try:
-            v_target = float((self.ed_v_exh.text() or "70").replace(",", "."))
-            assert v_target > 0
-        except Exception:  # pragma: no cover
+        if result is not None:
+            try:
+                ex = result.get("series", {}).get("exhaust", [])  # type: ignore[union-attr]
+                self._q_exh_peak = _q_peak_m3s(ex or [])
+            except Exception:  # pragma: no cover
+                self._q_exh_peak = 0.0
+        if not self._lazy_built:
+            return
+        v_target = 0.0
+        if self.ed_v_exh.hasAcceptableInput():
+            v_target = parse_float_pl(self.ed_v_exh.text() or "70")
+        if v_target <= 0:
             self.lbl_A_req.setText("A_req = — mm²")
             self.lbl_d_eq.setText("d_eq = — mm")
             return
-        if result is None:
-            try:
-                session = self.state.build_session_for_run_all()
-                result = run_all(
-                    session,
-                    dp_ref_inH2O=self.state.air_dp_ref_inH2O or 28.0,
-                    a_ref_mode="eff",
-                    eff_mode="smoothmin",
-                    engine_v_target=(self.state.engine_target_rpm or 100.0),
-                )
-            except Exception:  # pragma: no cover
-                result = None
-        q_peak = 0.0
-        try:
-            ex = (result or {}).get("series", {}).get("exhaust", [])  # type: ignore[union-attr]
-            if ex:
-                q_peak = max(float(r.get("q_m3s_ref") or 0.0) for r in ex)
-        except Exception:  # pragma: no cover
-            q_peak = 0.0
+        if self._q_exh_peak is None:
+            # v_target edits only need Q*_peak: take it from the rows, not from run_all
+            self._q_exh_peak = _q_peak_from_columns(
+                self._cols, self.state.air_dp_ref_inH2O or 28.0
+            )
+        q_peak = self._q_exh_peak or 0.0
         if q_peak > 0.0:
             try:
                 A_req = F.header_csa_required(q_peak, v_target)
                 A_mm2 = A_req * 1e6
-                d_eq = (4.0 * A_req / 3.141592653589793) ** 0.5 * 1000.0
+                d_eq = _sqrt(4.0 * A_req / _PI) * 1000.0
                 self.lbl_A_req.setText(f"A_req = {A_mm2:.0f} mm²")
                 self.lbl_d_eq.setText(f"d_eq = {d_eq:.1f} mm")
                 self.lbl_d_eq2.setText(f"d_eq = {d_eq:.1f} mm")
@@ -600,13 +769,6 @@ class StepExhaust(QWidget):
         else:
             self.lbl_A_req.setText("A_req = — mm²")
             self.lbl_d_eq.setText("d_eq = — mm")
-    
-    # Compatibility wrapper (older name used in _compute)
-    def _update_primary_length(self) -> None:
-        self._compute_primary_length()
 
 
 __all__ = ["StepExhaust"]
-
-if __name__ == "__main__":  # pragma: no cover
-    pass
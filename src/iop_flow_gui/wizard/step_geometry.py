@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+from contextlib import ExitStack
+from typing import Any, Dict, Optional, Tuple
 
-from PySide6.QtCore import Signal, QSettings
+import numpy as np
+from PySide6.QtCore import Signal, QSettings, QSignalBlocker, QTimer
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -16,7 +18,28 @@ from PySide6.QtWidgets import (
 from iop_flow import formulas as F
 
 from ..widgets.mpl_canvas import MplCanvas
-from .state import WizardState, parse_float_pl, is_valid_step_geometry, set_geometry_from_ui
+from .state import WizardState, try_parse_float_pl, is_valid_step_geometry, set_geometry_from_ui
+
+# L/D preview x-axis: 0..50 mm step 0.1, built once (only the 1/D scale changes per edit)
+_LIFTS_MM = np.arange(501) / 10.0
+_LIFTS_M = _LIFTS_MM / 1000.0
+# Shared with every preview Line2D: must never be modified in place
+_LIFTS_MM.setflags(write=False)
+_LIFTS_M.setflags(write=False)
+
+# QSettings keys (group "geom_default") for the fields, in StepGeometry._all_eds order
+_DEFAULT_KEYS = (
+    "bore_mm",
+    "valve_i_mm",
+    "valve_e_mm",
+    "throat_int_mm",
+    "throat_exh_mm",
+    "stem_mm",
+    "seat_angle_deg",
+    "seat_width_mm",
+    "port_volume_cc",
+    "port_length_mm",
+)
 
 
 class StepGeometry(QWidget):
@@ -25,6 +48,11 @@ class StepGeometry(QWidget):
     def __init__(self, state: WizardState) -> None:
         super().__init__()
         self.state = state
+        # Inputs behind the last drawn preview / last applied validity (None = not yet)
+        self._last_preview_key: Optional[tuple] = None
+        self._last_valid_key: Optional[tuple] = None
+        # Last (good, tip) applied per field by _apply_styles
+        self._style_state: Dict[QLineEdit, Tuple[bool, str]] = {}
 
         root = QHBoxLayout(self)
 
@@ -43,6 +71,20 @@ class StepGeometry(QWidget):
         self.ed_seat_width = QLineEdit(self)
         self.ed_port_vol = QLineEdit(self)
         self.ed_port_len = QLineEdit(self)
+        self._all_eds = (
+            self.ed_bore,
+            self.ed_valve_i,
+            self.ed_valve_e,
+            self.ed_throat_i,
+            self.ed_throat_e,
+            self.ed_stem,
+            self.ed_seat_angle,
+            self.ed_seat_width,
+            self.ed_port_vol,
+            self.ed_port_len,
+        )
+        # The first six are required; the rest are optional
+        self._req_eds = self._all_eds[:6]
 
         form.addRow("Adapter/Bore [mm]", self.ed_bore)
         form.addRow("Valve INT [mm]", self.ed_valve_i)
@@ -57,6 +99,7 @@ class StepGeometry(QWidget):
 
         # Prefill with defaults or last-used values to avoid blocking the wizard
         settings = QSettings("iop-flow", "wizard")
+        self._settings = settings
 
         def _load(key: str, fallback: Optional[str] = None) -> Optional[str]:
             val = settings.value(key, None, type=str)
@@ -64,38 +107,42 @@ class StepGeometry(QWidget):
                 return fallback
             return str(val)
 
-        # Use state if already set, otherwise last-used, otherwise sensible defaults
-        if self.state.geometry:
-            g = self.state.geometry
-            self.ed_bore.setText(f"{g.bore_m * 1000:.1f}")
-            self.ed_valve_i.setText(f"{g.valve_int_m * 1000:.1f}")
-            self.ed_valve_e.setText(f"{g.valve_exh_m * 1000:.1f}")
-            # Prefer split throats if available
-            t_i = g.throat_int_m if getattr(g, "throat_int_m", None) is not None else g.throat_m
-            t_e = g.throat_exh_m if getattr(g, "throat_exh_m", None) is not None else g.throat_m
-            self.ed_throat_i.setText(f"{t_i * 1000:.1f}")
-            self.ed_throat_e.setText(f"{t_e * 1000:.1f}")
-            self.ed_stem.setText(f"{g.stem_m * 1000:.1f}")
-            self.ed_seat_angle.setText("" if g.seat_angle_deg is None else f"{g.seat_angle_deg:.1f}")
-            self.ed_seat_width.setText("" if g.seat_width_m is None else f"{g.seat_width_m * 1000:.2f}")
-            self.ed_port_vol.setText("" if g.port_volume_cc is None else f"{g.port_volume_cc:.1f}")
-            self.ed_port_len.setText("" if g.port_length_m is None else f"{g.port_length_m * 1000:.1f}")
-        else:
-            self.ed_bore.setText(_load("geom_default/bore_mm", "86.0") or "86.0")
-            self.ed_valve_i.setText(_load("geom_default/valve_i_mm", "33.0") or "33.0")
-            self.ed_valve_e.setText(_load("geom_default/valve_e_mm", "28.0") or "28.0")
-            self.ed_throat_i.setText(_load("geom_default/throat_int_mm", _load("geom_default/throat_mm", "27.0")) or "27.0")
-            self.ed_throat_e.setText(_load("geom_default/throat_exh_mm", _load("geom_default/throat_mm", "27.0")) or "27.0")
-            self.ed_stem.setText(_load("geom_default/stem_mm", "7.0") or "7.0")
-            self.ed_seat_angle.setText(_load("geom_default/seat_angle_deg", "45.0") or "45.0")
-            self.ed_seat_width.setText(_load("geom_default/seat_width_mm", "1.5") or "1.5")
-            # Optional fields left blank by default, but load if previously saved
-            pv = _load("geom_default/port_volume_cc", None)
-            pl = _load("geom_default/port_length_mm", None)
-            if pv is not None:
-                self.ed_port_vol.setText(pv)
-            if pl is not None:
-                self.ed_port_len.setText(pl)
+        # Use state if already set, otherwise last-used, otherwise sensible defaults.
+        # Prefill is silent: one _do_update at the end of __init__ covers all fields.
+        with ExitStack() as stack:
+            for ed in self._all_eds:
+                stack.enter_context(QSignalBlocker(ed))
+            if self.state.geometry:
+                g = self.state.geometry
+                self.ed_bore.setText(f"{g.bore_m * 1000:.1f}")
+                self.ed_valve_i.setText(f"{g.valve_int_m * 1000:.1f}")
+                self.ed_valve_e.setText(f"{g.valve_exh_m * 1000:.1f}")
+                # Prefer split throats if available
+                t_i = g.throat_int_m if getattr(g, "throat_int_m", None) is not None else g.throat_m
+                t_e = g.throat_exh_m if getattr(g, "throat_exh_m", None) is not None else g.throat_m
+                self.ed_throat_i.setText(f"{t_i * 1000:.1f}")
+                self.ed_throat_e.setText(f"{t_e * 1000:.1f}")
+                self.ed_stem.setText(f"{g.stem_m * 1000:.1f}")
+                self.ed_seat_angle.setText("" if g.seat_angle_deg is None else f"{g.seat_angle_deg:.1f}")
+                self.ed_seat_width.setText("" if g.seat_width_m is None else f"{g.seat_width_m * 1000:.2f}")
+                self.ed_port_vol.setText("" if g.port_volume_cc is None else f"{g.port_volume_cc:.1f}")
+                self.ed_port_len.setText("" if g.port_length_m is None else f"{g.port_length_m * 1000:.1f}")
+            else:
+                self.ed_bore.setText(_load("geom_default/bore_mm", "86.0") or "86.0")
+                self.ed_valve_i.setText(_load("geom_default/valve_i_mm", "33.0") or "33.0")
+                self.ed_valve_e.setText(_load("geom_default/valve_e_mm", "28.0") or "28.0")
+                self.ed_throat_i.setText(_load("geom_default/throat_int_mm", _load("geom_default/throat_mm", "27.0")) or "27.0")
+                self.ed_throat_e.setText(_load("geom_default/throat_exh_mm", _load("geom_default/throat_mm", "27.0")) or "27.0")
+                self.ed_stem.setText(_load("geom_default/stem_mm", "7.0") or "7.0")
+                self.ed_seat_angle.setText(_load("geom_default/seat_angle_deg", "45.0") or "45.0")
+                self.ed_seat_width.setText(_load("geom_default/seat_width_mm", "1.5") or "1.5")
+                # Optional fields left blank by default, but load if previously saved
+                pv = _load("geom_default/port_volume_cc", None)
+                pl = _load("geom_default/port_length_mm", None)
+                if pv is not None:
+                    self.ed_port_vol.setText(pv)
+                if pl is not None:
+                    self.ed_port_len.setText(pl)
 
         # right preview
         right_wrap = QWidget(self)
@@ -113,45 +160,59 @@ class StepGeometry(QWidget):
         self.spin_lift.setValue(5.0)
         right.addWidget(self.spin_lift)
 
-        for w in (
-            self.ed_bore,
-            self.ed_valve_i,
-            self.ed_valve_e,
-            self.ed_throat_i,
-            self.ed_throat_e,
-            self.ed_stem,
-            self.ed_seat_angle,
-            self.ed_seat_width,
-            self.ed_port_vol,
-            self.ed_port_len,
-        ):
+        # Last-used inputs are written in one group on a much longer debounce
+        self._pending_defaults: Optional[dict] = None
+        self._persist_timer = QTimer(self)
+        self._persist_timer.setSingleShot(True)
+        self._persist_timer.setInterval(1500)
+        self._persist_timer.timeout.connect(self._persist_defaults)
+        # State and validity follow every keystroke (Next must never see stale input);
+        # only the matplotlib preview redraw is debounced, so typing bursts replot once
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(200)
+        self._preview_timer.timeout.connect(self._update_preview)
+        self._preview_dirty = False
+
+        # Raw field texts behind the last update
+        self._last_inputs: Optional[tuple] = None
+        for w in self._all_eds:
             w.textChanged.connect(self._on_changed)
-        self.spin_lift.valueChanged.connect(self._on_changed)
+        # The lift spin only moves the preview's lift marker; it is not a geometry input
+        self.spin_lift.valueChanged.connect(self._update_lift_cursor)
+
+        self._do_update()
 
-        self._on_changed()
+    def showEvent(self, event):  # type: ignore[override]
+        super().showEvent(event)
+        if self._preview_dirty:
+            self._preview_dirty = False
+            self._preview_timer.start()
+
+    def hideEvent(self, event):  # type: ignore[override]
+        # Leaving the step: a pending redraw waits for showEvent, pending defaults are written
+        if self._preview_timer.isActive():
+            self._preview_timer.stop()
+            self._preview_dirty = True
+        if self._persist_timer.isActive():
+            self._persist_timer.stop()
+            self._persist_defaults()
+        super().hideEvent(event)
 
     def _on_changed(self, *args: Any) -> None:  # noqa: ARG002
-        def f(ed: QLineEdit) -> Optional[float]:
-            t = ed.text().strip()
-            if not t:
-                return None
-            try:
-                return parse_float_pl(t)
-            except Exception:
-                return None
-
-        bore = f(self.ed_bore)
-        vi = f(self.ed_valve_i)
-        ve = f(self.ed_valve_e)
-        th_i = f(self.ed_throat_i)
-        th_e = f(self.ed_throat_e)
-        st = f(self.ed_stem)
-        ang = f(self.ed_seat_angle)
-        sw = f(self.ed_seat_width)
-        pv = f(self.ed_port_vol)
-        pl = f(self.ed_port_len)
-
-        if all(x is not None for x in (bore, vi, ve, th_i, th_e, st)):
+        self._do_update()
+
+    def _do_update(self, _parse=try_parse_float_pl) -> None:
+        cur = tuple(ed.text() for ed in self._all_eds)
+        if cur == self._last_inputs:
+            return
+        self._last_inputs = cur
+
+        # Partial input while typing ("1,", "-", "") parses to None without raising
+        vals = [_parse(t) for t in cur]
+        bore, vi, ve, th_i, th_e, st, ang, sw, pv, pl = vals
+
+        if all(x is not None for x in vals[: len(self._req_eds)]):
             set_geometry_from_ui(
                 self.state,
                 bore_mm=bore or 0.0,
@@ -166,58 +227,88 @@ class StepGeometry(QWidget):
                 port_volume_cc=pv,
                 port_length_mm=pl,
             )
-            # Persist last-used inputs for convenience across sessions
-            try:
-                settings = QSettings("iop-flow", "wizard")
-                settings.setValue("geom_default/bore_mm", self.ed_bore.text())
-                settings.setValue("geom_default/valve_i_mm", self.ed_valve_i.text())
-                settings.setValue("geom_default/valve_e_mm", self.ed_valve_e.text())
-                settings.setValue("geom_default/throat_int_mm", self.ed_throat_i.text())
-                settings.setValue("geom_default/throat_exh_mm", self.ed_throat_e.text())
-                settings.setValue("geom_default/stem_mm", self.ed_stem.text())
-                settings.setValue("geom_default/seat_angle_deg", self.ed_seat_angle.text())
-                settings.setValue("geom_default/seat_width_mm", self.ed_seat_width.text())
-                settings.setValue("geom_default/port_volume_cc", self.ed_port_vol.text())
-                settings.setValue("geom_default/port_length_mm", self.ed_port_len.text())
-            except Exception:
-                pass
+            # Persist last-used inputs for convenience across sessions (snapshot of a
+            # complete geometry; written later by _persist_defaults)
+            self._pending_defaults = dict(zip(_DEFAULT_KEYS, cur))
+            self._persist_timer.start()
         else:
             self.state.geometry = None
 
-        # preview: A_throat and L/D lines
+        # preview: A_throat and L/D lines; redraw only when the inputs they use change
         g = self.state.geometry
         if g:
             t_i_m = g.throat_int_m if getattr(g, "throat_int_m", None) is not None else g.throat_m
             t_e_m = g.throat_exh_m if getattr(g, "throat_exh_m", None) is not None else g.throat_m
-            Ath_i_mm2 = F.area_throat(t_i_m, g.stem_m) * 1e6
-            Ath_e_mm2 = F.area_throat(t_e_m, g.stem_m) * 1e6
+            key: tuple = (t_i_m, t_e_m, g.stem_m, g.valve_int_m, g.valve_exh_m)
+        else:
+            key = ()
+        if key != self._last_preview_key:
+            self._last_preview_key = key
+            if self.preview.isVisible():
+                self._preview_timer.start()
+            else:
+                # Hidden step: draw once when it is shown again
+                self._preview_dirty = True
+
+        ok = is_valid_step_geometry(self.state)
+        # Styles depend on the same values; the signal only on ok
+        if (ok, key) != self._last_valid_key:
+            self._apply_styles(ok)
+            if self._last_valid_key is None or ok != self._last_valid_key[0]:
+                self.sig_valid_changed.emit(ok)
+            self._last_valid_key = (ok, key)
+
+    def _update_lift_cursor(self, value: float) -> None:
+        if self.state.geometry is None:
+            return
+        self.preview.set_vline(value)
+        self.preview.render()
+
+    def _persist_defaults(self) -> None:
+        values, self._pending_defaults = self._pending_defaults, None
+        if not values:
+            return
+        try:
+            st = self._settings
+            st.beginGroup("geom_default")
+            for key, val in values.items():
+                st.setValue(key, val)
+            st.endGroup()
+            st.sync()
+        except Exception:
+            pass
+
+    def _update_preview(self) -> None:
+        g = self.state.geometry
+        if g:
+            t_i_m = g.throat_int_m if getattr(g, "throat_int_m", None) is not None else g.throat_m
+            t_e_m = g.throat_exh_m if getattr(g, "throat_exh_m", None) is not None else g.throat_m
+            area = F.area_throat
+            Ath_i_mm2 = area(t_i_m, g.stem_m) * 1e6
+            Ath_e_mm2 = area(t_e_m, g.stem_m) * 1e6
             self.lbl_Ath.setText(f"A_throat INT/EXH: {Ath_i_mm2:.2f} / {Ath_e_mm2:.2f} mm²")
             # L/D vs lift for INT and EXH
-            lifts = [i / 10.0 for i in range(0, 501)]  # 0..50 mm step 0.1
-            x = lifts
-            ld_i = [(lift / 1000.0) / g.valve_int_m for lift in lifts]
-            ld_e = [(lift / 1000.0) / g.valve_exh_m for lift in lifts]
-            self.preview.clear()
-            self.preview.plot_xy(x, ld_i, label="L/D INT")
-            self.preview.plot_xy(x, ld_e, label="L/D EXH")
+            ld_i = _LIFTS_M / g.valve_int_m
+            ld_e = _LIFTS_M / g.valve_exh_m
+            # Both curves share x: one collection artist, only its segments are swapped
+            self.preview.update_curves(_LIFTS_MM, (ld_i, ld_e), ("L/D INT", "L/D EXH"))
+            self.preview.set_vline(self.spin_lift.value())
             self.preview.render()
         else:
             self.lbl_Ath.setText("A_throat INT/EXH: — / — mm²")
             self.preview.clear()
             self.preview.render()
 
-        ok = is_valid_step_geometry(self.state)
-        self._apply_styles(ok)
-        self.sig_valid_changed.emit(ok)
-
     def _apply_styles(self, ok: bool) -> None:
+        # Final (good, tip) per field first, then touch only the fields whose mark changed:
+        # setStyleSheet re-polishes and repaints the widget even for the same sheet
+        marks: Dict[QLineEdit, Tuple[bool, str]] = {}
+
         def mark(ed: QLineEdit, good: bool, tip: str = "Błąd wartości") -> None:
-            ed.setStyleSheet("" if good else "border: 1px solid red")
-            ed.setToolTip("" if good else tip)
+            marks[ed] = (good, "" if good else tip)
 
         g = self.state.geometry
-        req = [self.ed_bore, self.ed_valve_i, self.ed_valve_e, self.ed_throat_i, self.ed_throat_e, self.ed_stem]
-        for ed in req:
+        for ed in self._req_eds:
             mark(ed, g is not None)
         # relations if geometry present
         if g:
@@ -227,3 +318,9 @@ class StepGeometry(QWidget):
             mark(self.ed_stem, g.stem_m < min(t_i_m, t_e_m), "stem < throat")
             mark(self.ed_valve_i, g.valve_int_m > t_i_m, "> throat")
             mark(self.ed_valve_e, g.valve_exh_m > t_e_m, "> throat")
+        for ed, (good, tip) in marks.items():
+            if self._style_state.get(ed) == (good, tip):
+                continue
+            self._style_state[ed] = (good, tip)
+            ed.setStyleSheet("" if good else "border: 1px solid red")
+            ed.setToolTip(tip)
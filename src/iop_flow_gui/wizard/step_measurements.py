@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
-from PySide6.QtCore import Qt, QTimer, Signal, QEvent
+import numpy as np
+from PySide6.QtCore import QThreadPool, QTimer, Signal, QEvent
 from PySide6.QtGui import QKeyEvent, QKeySequence
 from PySide6.QtWidgets import (
     QWidget,
@@ -11,23 +15,64 @@ from PySide6.QtWidgets import (
     QPushButton,
     QLabel,
     QTabWidget,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
+    QHeaderView,
     QMessageBox,
     QAbstractItemView,
+    QApplication,
+    QComboBox,
+    QDoubleSpinBox,
+    QGroupBox,
+    QLineEdit,
+    QToolButton,
 )
 
-from iop_flow.api import run_all
+from iop_flow import formulas as F
 from iop_flow.schemas import Session
-
-from .state import WizardState, parse_rows
+from iop_flow.tuning import sweep_exhaust_L, sweep_intake_L
+
+from .compute_task import RunAllTask
+from .state import (
+    WizardState,
+    air_density_cached,
+    is_valid_step_bench,
+    is_valid_step_geometry,
+    parse_float_pl,
+)
+from .measure_model import (
+    MeasureColumns,
+    MeasureItemDelegate,
+    MeasureTableModel,
+    batch_updates,
+    clean_array,
+    merge_lifts,
+    parse_rows_array_counted,
+)
 from ..widgets.mpl_canvas import MplCanvas
 from ..preferences import load_prefs
 
 
+# (lift, Cd, Q) rows streamed by np.fromiter straight into an (N, 3) float64 block
+_ROW3 = np.dtype((np.float64, 3))
+
+
+@lru_cache(maxsize=64)
+def _speed_of_sound_C(t_C: float) -> float:
+    # Pitot panel: the temperature field rarely changes between clicks
+    return F.speed_of_sound(F.C_to_K(t_C))
+
+
 class _SideTable(QWidget):
     sig_changed = Signal()
 
+    # Human-friendly headers and tooltips, in COLUMNS order
+    _HEADERS = (
+        ("Lift [mm]", "Skok zaworu; wartości z planu"),
+        ("Q [CFM] @ ΔP_meas", "Przepływ zmierzony; w CFM"),
+        ("ΔP [\"H₂O]", "Depresja pomiarowa"),
+        ("Swirl [RPM]", "Swirl obrotowy, jeśli mierzony"),
+    )
+
     def __init__(self, state: WizardState, side: str) -> None:
         super().__init__()
         self.state = state
@@ -44,22 +89,21 @@ class _SideTable(QWidget):
         btns.addWidget(self.btn_clear)
         btns.addStretch(1)
 
-        self.table = QTableWidget(self)
-        self.table.setColumnCount(4)
-        # Human-friendly headers and tooltips
-        headers = [
-            ("Lift [mm]", "Skok zaworu; wartości z planu"),
-            ("Q [CFM] @ ΔP_meas", "Przepływ zmierzony; w CFM"),
-            ("ΔP [\"H₂O]", "Depresja pomiarowa"),
-            ("Swirl [RPM]", "Swirl obrotowy, jeśli mierzony"),
-        ]
-        from PySide6.QtWidgets import QTableWidgetItem as _QItem
-
-        self.table.setHorizontalHeaderLabels([h for h, _ in headers])
-        for c, (h, tip) in enumerate(headers):
-            it = _QItem(h)
-            it.setToolTip(tip)
-            self.table.setHorizontalHeaderItem(c, it)
+        # Table (view over a NumPy-backed model): an edit parses and stores one cell, the
+        # model paints invalid cells itself
+        self.model = MeasureTableModel(
+            [h for h, _ in self._HEADERS],
+            parent=self,
+            header_tips=[tip for _, tip in self._HEADERS],
+            mark_invalid=True,
+        )
+        self.table = QTableView(self)
+        self.table.setModel(self.model)
+        self.table.setItemDelegate(MeasureItemDelegate(self.model, self.table))
+        # Fixed row heights: the view lays out only visible rows, no per-row size hints
+        vh = self.table.verticalHeader()
+        vh.setSectionResizeMode(QHeaderView.Fixed)
+        vh.setDefaultSectionSize(self.table.fontMetrics().height() + 8)
         self.table.setEditTriggers(QAbstractItemView.AllEditTriggers)
         self.table.setSelectionBehavior(QAbstractItemView.SelectItems)
         self.table.setSelectionMode(QAbstractItemView.ContiguousSelection)
@@ -74,7 +118,12 @@ class _SideTable(QWidget):
         self.btn_autofill.clicked.connect(self._autofill)
         self.btn_copy_other.clicked.connect(self._copy_other)
         self.btn_clear.clicked.connect(self._clear)
-        self.table.itemChanged.connect(self._on_changed)
+        # Bursts of cell edits are coalesced into one save/count pass
+        self._edit_debounce = QTimer(self)
+        self._edit_debounce.setSingleShot(True)
+        self._edit_debounce.setInterval(50)
+        self._edit_debounce.timeout.connect(self._flush_edits)
+        self.model.sig_edited.connect(self._on_changed)
         self.table.viewport().installEventFilter(self)
 
         self._load_from_state()
@@ -95,139 +144,66 @@ class _SideTable(QWidget):
                 return True
         return super().eventFilter(obj, event)
 
-    def _load_from_state(self) -> None:
-        rows = self.state.measure_intake if self.side == "intake" else self.state.measure_exhaust
-        self.table.blockSignals(True)
-        self.table.setRowCount(len(rows))
-        for r, row in enumerate(rows):
-            for c, key in enumerate(["lift_mm", "q_cfm", "dp_inH2O", "swirl_rpm"]):
-                val = row.get(key)
-                self.table.setItem(r, c, QTableWidgetItem("" if val is None else str(val)))
-        self.table.blockSignals(False)
+    def _rows(self) -> List[Dict[str, Any]]:
+        return self.state.measure_intake if self.side == "intake" else self.state.measure_exhaust
 
-    def _save_to_state(self) -> None:
-        def parse_item(it: Optional[QTableWidgetItem]) -> Optional[float]:
-            if it is None:
-                return None
-            s = (it.text() or "").strip()
-            if s == "":
-                return None
-            try:
-                # reuse parse_rows logic: comma and dot accepted
-                from .state import parse_float_pl
-
-                return parse_float_pl(s)
-            except Exception:
-                return None
-
-        rows: List[Dict[str, Any]] = []
-        seen: Dict[float, int] = {}
-        for r in range(self.table.rowCount()):
-            lift = parse_item(self.table.item(r, 0))
-            q = parse_item(self.table.item(r, 1))
-            dp = parse_item(self.table.item(r, 2))
-            swirl = parse_item(self.table.item(r, 3))
-            if lift is None or q is None:
-                continue
-            lift = round(max(lift, 0.0), 3)
-            row: Dict[str, Any] = {"lift_mm": lift, "q_cfm": max(q, 0.0)}
-            if dp is not None and dp > 0:
-                row["dp_inH2O"] = dp
-            if swirl is not None and swirl >= 0:
-                row["swirl_rpm"] = swirl
-            # keep last by lift
-            if lift in seen:
-                rows[seen[lift]] = row
-            else:
-                seen[lift] = len(rows)
-                rows.append(row)
-        rows.sort(key=lambda x: x["lift_mm"])  # sort increasing
+    def _set_rows(self, rows: List[Dict[str, Any]]) -> None:
         if self.side == "intake":
             self.state.measure_intake = rows
         else:
             self.state.measure_exhaust = rows
 
-    def _apply_cell_validation(self) -> None:
-        # Apply tooltip and background color on invalid cells
-        def mark(item: Optional[QTableWidgetItem], good: bool, tip: str = "") -> None:
-            if not item:
-                return
-            item.setToolTip("" if good else (tip or "Błędna wartość"))
-            item.setBackground(Qt.white if good else Qt.red)  # type: ignore[arg-type]
-
-        for r in range(self.table.rowCount()):
-            it_l = self.table.item(r, 0)
-            it_q = self.table.item(r, 1)
-            it_dp = self.table.item(r, 2)
-            it_sw = self.table.item(r, 3)
-
-            def parse_opt(it: Optional[QTableWidgetItem]) -> Optional[float]:
-                if it is None:
-                    return None
-                s = (it.text() or "").strip()
-                if s == "":
-                    return None
-                try:
-                    from .state import parse_float_pl
-
-                    return parse_float_pl(s)
-                except Exception:
-                    return None
-
-            l_v = parse_opt(it_l)
-            q_v = parse_opt(it_q)
-            dp_v = parse_opt(it_dp)
-            sw_v = parse_opt(it_sw)
-            mark(it_l, l_v is not None and l_v >= 0, ">= 0")
-            mark(it_q, q_v is not None and q_v >= 0, ">= 0")
-            mark(it_dp, dp_v is None or dp_v > 0, "> 0 lub puste")
-            mark(it_sw, sw_v is None or sw_v >= 0, ">= 0 lub puste")
+    def _load_from_state(self) -> None:
+        rows = self._rows()
+        self._cols = MeasureColumns.from_rows(rows)
+        with batch_updates(self.table):
+            self.model.set_rows(rows)
+
+    def _apply_rows(self, rows: List[Dict[str, Any]]) -> None:
+        # Rows sorted by lift: diff-update the table instead of rebuilding it from state
+        self._edit_debounce.stop()
+        self._set_rows(rows)
+        self._cols = MeasureColumns.from_rows(rows)
+        with batch_updates(self.table):
+            self.model.apply_rows(rows)
+        self._update_counts()
+        self.sig_changed.emit()
+
+    def _save_to_state(self) -> None:
+        # Dedup by lift (last wins), clamping and sort are vectorized on the cell array
+        self._cols = MeasureColumns.from_array(clean_array(self.model.array))
+        self._set_rows(self._cols.to_rows())
 
     def _update_counts(self) -> None:
-        rows = self.state.measure_intake if self.side == "intake" else self.state.measure_exhaust
-        n = len(rows)
-        m = sum(1 for r in rows if r.get("dp_inH2O") is not None)
-        k = sum(1 for r in rows if r.get("swirl_rpm") is not None)
+        cols = self._cols
+        n, m, k = len(cols), cols.count_dp(), cols.count_swirl()
         self.lbl_counts.setText(f"n: {n}, z dp: {m}, ze swirl: {k}")
 
     def _on_changed(self, *args: Any) -> None:  # noqa: ARG002
+        self._edit_debounce.start()
+
+    def _flush_edits(self) -> None:
+        self._edit_debounce.stop()
         self._save_to_state()
-        self._apply_cell_validation()
         self._update_counts()
         self.sig_changed.emit()
 
-    def _paste_from_clipboard(self) -> None:
-        from PySide6.QtWidgets import QApplication
+    def hideEvent(self, event):  # type: ignore[override]
+        # Switching tab/step: pending cell edits must reach the state first
+        if self._edit_debounce.isActive():
+            self._flush_edits()
+        super().hideEvent(event)
 
+    def _paste_from_clipboard(self) -> None:
         clipboard = QApplication.clipboard().text()
         text = clipboard or ""
-        rows = parse_rows(text)
-        # Estimate bad rows: count non-empty logical lines with >=2 fields, then subtract parsed
-        bad = 0
-        for raw in text.splitlines():
-            line = raw.strip()
-            if not line:
-                continue
-            parts = [
-                p.strip()
-                for p in (line.split(";") if ";" in line else line.replace("\t", " ").split())
-                if p
-            ]
-            if len(parts) >= 2:
-                # candidate line; if parse_rows didn't include it, count as bad
-                # crude heuristic: will be overcounted if duplicates trimmed; acceptable for toast
-                bad += 1
-        bad = max(0, bad - len(rows))
-        if not rows:
+        block, bad = parse_rows_array_counted(text)
+        if block.shape[0] == 0:
             return
-        start = self.table.rowCount()
-        self.table.setRowCount(start + len(rows))
-        for i, (lift, q, dp, swirl) in enumerate(rows):
-            r = start + i
-            vals = [lift, q, dp if dp is not None else "", swirl if swirl is not None else ""]
-            for c, v in enumerate(vals):
-                self.table.setItem(r, c, QTableWidgetItem(str(v)))
-        self._on_changed()
+        # One insert notification for the block, one save for all of it
+        with batch_updates(self.table):
+            self.model.append_array(block)
+        self._flush_edits()
         # Show non-blocking toast in status bar if some lines were skipped
         if bad > 0:
             try:
@@ -244,53 +220,52 @@ class _SideTable(QWidget):
         if not plan:
             QMessageBox.information(self, "Plan", "Brak planu dla tej strony.")
             return
-        rows_map: Dict[float, Dict[str, Any]] = {
-            (row.get("lift_mm") or 0.0): dict(row)
-            for row in (
-                self.state.measure_intake if self.side == "intake" else self.state.measure_exhaust
-            )
-        }
-        for lift in plan:
-            if lift not in rows_map:
-                rows_map[lift] = {"lift_mm": lift}
-        merged = [rows_map[k] for k in sorted(rows_map.keys())]
-        if self.side == "intake":
-            self.state.measure_intake = merged
-        else:
-            self.state.measure_exhaust = merged
-        self._load_from_state()
-        self._update_counts()
-        self.sig_changed.emit()
+        if self._edit_debounce.isActive():
+            self._flush_edits()
+        existing = self._rows()
+        rows = merge_lifts(existing, plan)
+        if rows is not existing:
+            self._apply_rows(rows)
 
     def _copy_other(self) -> None:
         other = self.state.measure_exhaust if self.side == "intake" else self.state.measure_intake
-        copied = [dict(r) for r in other]
-        if self.side == "intake":
-            self.state.measure_intake = copied
-        else:
-            self.state.measure_exhaust = copied
+        self._edit_debounce.stop()
+        # Rows are never mutated in place (saves build new dicts): share them, don't copy
+        self._set_rows(list(other))
         self._load_from_state()
         self._update_counts()
         self.sig_changed.emit()
 
     def _clear(self) -> None:
-        if self.side == "intake":
-            self.state.measure_intake = []
-        else:
-            self.state.measure_exhaust = []
+        self._edit_debounce.stop()
+        self._set_rows([])
         self._load_from_state()
         self._update_counts()
         self.sig_changed.emit()
 
 
-
 class StepMeasurements(QWidget):
     sig_valid_changed = Signal(bool)
 
+    _SWEEP_CACHE_SIZE = 16
+    _RESULT_CACHE_SIZE = 2
+
     def __init__(self, state: WizardState) -> None:
         super().__init__()
         self.state = state
         self._auto_done = False  # uniform auto-compute pattern
+        # Last run_all inputs/result and the side plotted from it; see _recompute
+        self._last_compute_key: Optional[Tuple[Any, ...]] = None
+        self._last_result: Optional[Dict[str, Any]] = None
+        self._last_plot_side: Optional[str] = None
+        # Recent run_all results by input key (an edit undone, a prefs flip back)
+        self._result_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+        # Background run_all: one task at a time, a request while busy reruns after it
+        self._busy = False
+        self._compute_pending = False
+        self._task: Optional[RunAllTask] = None
+        # Iterator sweeps by (side, L range, n, D, T, rpm_target), least recently used first
+        self._sweep_cache: "OrderedDict[Tuple[Any, ...], List[Any]]" = OrderedDict()
         self._debounce = QTimer(self)
         self._debounce.setInterval(150)
         self._debounce.setSingleShot(True)
@@ -307,77 +282,11 @@ class StepMeasurements(QWidget):
         self.tabs.addTab(self.tab_intake, "INTAKE")
         self.tabs.addTab(self.tab_exhaust, "EXHAUST")
 
-        # Iterator tab (L sweep → RPM)
-        from PySide6.QtWidgets import QGroupBox, QDoubleSpinBox, QComboBox
-
+        # Iterator tab (L sweep → RPM): empty until first opened, see _build_iterator_tab
         self.tab_iterator = QWidget(self)
-        iter_lay = QVBoxLayout(self.tab_iterator)
-        box = QGroupBox("Iterator L→RPM", self.tab_iterator)
-        box_lay = QVBoxLayout(box)
-        # Row inputs
-        row1_iter = QHBoxLayout()
-        box_lay.addLayout(row1_iter)
-        self.spn_L_min = QDoubleSpinBox(self)
-        self.spn_L_min.setRange(50, 1200)
-        self.spn_L_min.setValue(250)
-        self.spn_L_max = QDoubleSpinBox(self)
-        self.spn_L_max.setRange(50, 1200)
-        self.spn_L_max.setValue(600)
-        self.spn_L_step = QDoubleSpinBox(self)
-        self.spn_L_step.setRange(1, 200)
-        self.spn_L_step.setValue(10)
-        for w in (self.spn_L_min, self.spn_L_max, self.spn_L_step):
-            w.setDecimals(0)
-        row1_iter.addWidget(QLabel("L_min", self))
-        row1_iter.addWidget(self.spn_L_min)
-        row1_iter.addWidget(QLabel("L_max", self))
-        row1_iter.addWidget(self.spn_L_max)
-        row1_iter.addWidget(QLabel("step", self))
-        row1_iter.addWidget(self.spn_L_step)
-        row1_iter.addStretch(1)
-        # Row 2: n_harm, D_mm, T_int, T_exh
-        row2_iter = QHBoxLayout()
-        box_lay.addLayout(row2_iter)
-        self.cmb_iter_n = QComboBox(self)
-        self.cmb_iter_n.addItems(["1", "2", "3"])
-        self.cmb_iter_n.setCurrentIndex(1)
-        self.spn_iter_D = QDoubleSpinBox(self)
-        self.spn_iter_D.setRange(10, 120)
-        self.spn_iter_D.setValue(50)
-        self.spn_iter_D.setDecimals(1)
-        self.spn_iter_D.setSingleStep(0.5)
-        self.spn_iter_T_int = QDoubleSpinBox(self)
-        self.spn_iter_T_int.setRange(250, 500)
-        self.spn_iter_T_int.setValue(293)
-        self.spn_iter_T_int.setDecimals(0)
-        self.spn_iter_T_exh = QDoubleSpinBox(self)
-        self.spn_iter_T_exh.setRange(400, 1200)
-        self.spn_iter_T_exh.setValue(700)
-        self.spn_iter_T_exh.setDecimals(0)
-        row2_iter.addWidget(QLabel("n_harm", self))
-        row2_iter.addWidget(self.cmb_iter_n)
-        row2_iter.addWidget(QLabel("D_mm", self))
-        row2_iter.addWidget(self.spn_iter_D)
-        row2_iter.addWidget(QLabel("T_int[K]", self))
-        row2_iter.addWidget(self.spn_iter_T_int)
-        row2_iter.addWidget(QLabel("T_exh[K]", self))
-        row2_iter.addWidget(self.spn_iter_T_exh)
-        row2_iter.addStretch(1)
-        # Buttons
-        row_btn = QHBoxLayout()
-        box_lay.addLayout(row_btn)
-        self.btn_scan_intake = QPushButton("Skanuj INT", self)
-        self.btn_scan_exhaust = QPushButton("Skanuj EXH", self)
-        row_btn.addWidget(self.btn_scan_intake)
-        row_btn.addWidget(self.btn_scan_exhaust)
-        row_btn.addStretch(1)
-        # Plot canvas
-        self.plot_iter = MplCanvas()
-        self.plot_iter.set_readout_units("L_mm", "RPM")
-        box_lay.addWidget(self.plot_iter)
-        iter_lay.addWidget(box)
+        self._iterator_built = False
         self.tabs.addTab(self.tab_iterator, "Iterator")
-        self.tabs.currentChanged.connect(lambda _: self._recompute())
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         left.addWidget(self.tabs)
 
         # Action buttons
@@ -397,8 +306,6 @@ class StepMeasurements(QWidget):
         self.plot_q = MplCanvas()
         info_row = QHBoxLayout()
         info_row.addStretch(1)
-        from PySide6.QtWidgets import QToolButton
-
         self.btn_info = QToolButton(self)
         self.btn_info.setText("i")
         self.btn_info.setToolTip("Informacje o Cd i Q*")
@@ -413,8 +320,6 @@ class StepMeasurements(QWidget):
         right.addWidget(self.lbl_ei)
 
         # Pitot mini-panel
-        from PySide6.QtWidgets import QLineEdit, QGroupBox
-
         pit_row = QVBoxLayout()
         gb = QGroupBox("Pitot (lokalna prędkość)", self)
         gb_l = QVBoxLayout(gb)
@@ -462,16 +367,99 @@ class StepMeasurements(QWidget):
         # Connections
         self.btn_compute.clicked.connect(self._recompute)
         self.btn_pit_calc.clicked.connect(self._compute_pitot)
-        self.btn_scan_intake.clicked.connect(lambda: self._run_iterator(side="intake"))
-        self.btn_scan_exhaust.clicked.connect(lambda: self._run_iterator(side="exhaust"))
         # Mirror wizard navigation
         self.btn_back.clicked.connect(lambda: getattr(self.window(), "_go_back", lambda: None)())
         self.btn_next.clicked.connect(lambda: getattr(self.window(), "_go_next", lambda: None)())
         self._on_changed()
         QTimer.singleShot(0, self._auto_compute_once)
 
+    def _build_iterator_tab(self) -> None:
+        # Spin boxes and a matplotlib figure nobody may ever look at: built on first open
+        self._iterator_built = True
+        iter_lay = QVBoxLayout(self.tab_iterator)
+        box = QGroupBox("Iterator L→RPM", self.tab_iterator)
+        box_lay = QVBoxLayout(box)
+        # Row inputs
+        row1_iter = QHBoxLayout()
+        box_lay.addLayout(row1_iter)
+        self.spn_L_min = QDoubleSpinBox(self)
+        self.spn_L_min.setRange(50, 1200)
+        self.spn_L_min.setValue(250)
+        self.spn_L_max = QDoubleSpinBox(self)
+        self.spn_L_max.setRange(50, 1200)
+        self.spn_L_max.setValue(600)
+        self.spn_L_step = QDoubleSpinBox(self)
+        self.spn_L_step.setRange(1, 200)
+        self.spn_L_step.setValue(10)
+        for w in (self.spn_L_min, self.spn_L_max, self.spn_L_step):
+            w.setDecimals(0)
+        row1_iter.addWidget(QLabel("L_min", self))
+        row1_iter.addWidget(self.spn_L_min)
+        row1_iter.addWidget(QLabel("L_max", self))
+        row1_iter.addWidget(self.spn_L_max)
+        row1_iter.addWidget(QLabel("step", self))
+        row1_iter.addWidget(self.spn_L_step)
+        row1_iter.addStretch(1)
+        # Row 2: n_harm, D_mm, T_int, T_exh
+        row2_iter = QHBoxLayout()
+        box_lay.addLayout(row2_iter)
+        self.cmb_iter_n = QComboBox(self)
+        self.cmb_iter_n.addItems(["1", "2", "3"])
+        self.cmb_iter_n.setCurrentIndex(1)
+        self.spn_iter_D = QDoubleSpinBox(self)
+        self.spn_iter_D.setRange(10, 120)
+        self.spn_iter_D.setValue(50)
+        self.spn_iter_D.setDecimals(1)
+        self.spn_iter_D.setSingleStep(0.5)
+        self.spn_iter_T_int = QDoubleSpinBox(self)
+        self.spn_iter_T_int.setRange(250, 500)
+        self.spn_iter_T_int.setValue(293)
+        self.spn_iter_T_int.setDecimals(0)
+        self.spn_iter_T_exh = QDoubleSpinBox(self)
+        self.spn_iter_T_exh.setRange(400, 1200)
+        self.spn_iter_T_exh.setValue(700)
+        self.spn_iter_T_exh.setDecimals(0)
+        row2_iter.addWidget(QLabel("n_harm", self))
+        row2_iter.addWidget(self.cmb_iter_n)
+        row2_iter.addWidget(QLabel("D_mm", self))
+        row2_iter.addWidget(self.spn_iter_D)
+        row2_iter.addWidget(QLabel("T_int[K]", self))
+        row2_iter.addWidget(self.spn_iter_T_int)
+        row2_iter.addWidget(QLabel("T_exh[K]", self))
+        row2_iter.addWidget(self.spn_iter_T_exh)
+        row2_iter.addStretch(1)
+        # Buttons
+        row_btn = QHBoxLayout()
+        box_lay.addLayout(row_btn)
+        self.btn_scan_intake = QPushButton("Skanuj INT", self)
+        self.btn_scan_exhaust = QPushButton("Skanuj EXH", self)
+        row_btn.addWidget(self.btn_scan_intake)
+        row_btn.addWidget(self.btn_scan_exhaust)
+        row_btn.addStretch(1)
+        # Plot canvas
+        self.plot_iter = MplCanvas()
+        self.plot_iter.set_readout_units("L_mm", "RPM")
+        box_lay.addWidget(self.plot_iter)
+        iter_lay.addWidget(box)
+        self.btn_scan_intake.clicked.connect(lambda: self._run_iterator(side="intake"))
+        self.btn_scan_exhaust.clicked.connect(lambda: self._run_iterator(side="exhaust"))
+
+    def _on_tab_changed(self, index: int) -> None:
+        if self.tabs.widget(index) is self.tab_iterator and not self._iterator_built:
+            self._build_iterator_tab()
+        # Edits reach run_all through the debounce; a tab switch only redraws the result
+        if self._busy or self._debounce.isActive():
+            return  # the pending run plots the current side
+        if self._last_result is None:
+            self._recompute()
+        else:
+            self._repaint()
+
     def showEvent(self, event):  # type: ignore[override]
         super().showEvent(event)
+        if self._auto_done:
+            # Back from another step: its inputs may have changed (no-op if not)
+            self._recompute()
         self._auto_compute_once()
 
     def _auto_compute_once(self) -> None:
@@ -487,8 +475,6 @@ class StepMeasurements(QWidget):
 
     def _run_iterator(self, side: str) -> None:
         try:
-            from iop_flow.tuning import sweep_intake_L, sweep_exhaust_L
-
             L_min = float(self.spn_L_min.value())
             L_max = float(self.spn_L_max.value())
             step = float(self.spn_L_step.value())
@@ -500,18 +486,25 @@ class StepMeasurements(QWidget):
             rpm_target = float(self.state.engine_target_rpm or 6500)
             if L_min >= L_max or step <= 0:
                 return
-            if side == "intake":
-                data = sweep_intake_L(L_min, L_max, step, n, D_m, T_int, rpm_target)
-                self.state.tuning["intake_sweep"] = data
+            T = T_int if side == "intake" else T_exh
+            key = (side, L_min, L_max, step, n, D_m, T, rpm_target)
+            data = self._sweep_cache.get(key)
+            if data is None:
+                sweep = sweep_intake_L if side == "intake" else sweep_exhaust_L
+                data = sweep(L_min, L_max, step, n, D_m, T, rpm_target)
+                self._sweep_cache[key] = data
+                if len(self._sweep_cache) > self._SWEEP_CACHE_SIZE:
+                    self._sweep_cache.popitem(last=False)
             else:
-                data = sweep_exhaust_L(L_min, L_max, step, n, D_m, T_exh, rpm_target)
-                self.state.tuning["exhaust_sweep"] = data
+                self._sweep_cache.move_to_end(key)
+            self.state.tuning[f"{side}_sweep"] = list(data)
             xs = [p[0] for p in data]
             ys = [p[1] for p in data]
-            self.plot_iter.clear()
             label = "INT" if side == "intake" else "EXH"
-            if xs and ys:
-                self.plot_iter.plot_xy(
+            if not (xs and ys):
+                self.plot_iter.clear()
+            else:
+                self.plot_iter.update_line(
                     xs,
                     ys,
                     label=label,
@@ -533,14 +526,14 @@ class StepMeasurements(QWidget):
         self.sig_valid_changed.emit(bool(ok_prev and ok_data))
 
     def _prev_steps_ok(self) -> bool:
-        from .state import is_valid_step_bench, is_valid_step_geometry
-
         return is_valid_step_bench(self.state) and is_valid_step_geometry(self.state)
 
     def _recompute(self) -> None:
         if not self._prev_steps_ok():
             return
         if not (self.state.measure_intake or self.state.measure_exhaust):
+            self._last_compute_key = None
+            self._last_result = None
             try:
                 self.plot_cd.clear()
                 self.plot_q.clear()
@@ -551,22 +544,57 @@ class StepMeasurements(QWidget):
             except Exception:
                 pass
             return
+        prefs = load_prefs()
+        key = self._compute_key(prefs)
+        if key is not None and key == self._last_compute_key:
+            # Inputs unchanged (refocus, Przelicz): redraw only if the plotted side differs
+            self._repaint()
+            return
+        cached = self._result_cache.get(key) if key is not None else None
+        if cached is not None:
+            self._result_cache.move_to_end(key)
+            self._last_compute_key = key
+            self._last_result = cached
+            self._last_plot_side = None
+            self._repaint()
+            return
+        if self._busy:
+            self._compute_pending = True
+            return
         try:
             session: Session = self.state.build_session_from_wizard_for_compute()
         except Exception:
             return
-        prefs = load_prefs()
-        import time
-
-        t0 = time.perf_counter()
-        try:
-            result = run_all(
-                session,
-                dp_ref_inH2O=(prefs.dp_ref_inH2O or 28.0),
-                a_ref_mode=prefs.a_ref_mode,
-                eff_mode=prefs.eff_mode,
-            )
-        except Exception:
+        kwargs: Dict[str, Any] = {
+            "dp_ref_inH2O": (prefs.dp_ref_inH2O or 28.0),
+            "a_ref_mode": prefs.a_ref_mode,
+            "eff_mode": prefs.eff_mode,
+        }
+        # run_all off the GUI thread; _on_run_all_finished plots the result
+        self._busy = True
+        self.btn_compute.setEnabled(False)
+        task = RunAllTask(session, kwargs, (key, time.perf_counter()))
+        task.signals.finished.connect(self._on_run_all_finished)
+        self._task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _current_side(self) -> str:
+        return "intake" if self.tabs.currentIndex() == 0 else "exhaust"
+
+    def _repaint(self) -> None:
+        """Plot the last result for the current tab's side unless it is already shown."""
+        side = self._current_side()
+        if self._last_result is not None and side != self._last_plot_side:
+            self._show_result(self._last_result, side, time.perf_counter())
+
+    def _on_run_all_finished(self, token: Any, result: Any) -> None:
+        key, t0 = token
+        self._busy = False
+        self._task = None
+        if isinstance(result, Exception):
+            self._last_compute_key = None
+            self._last_result = None
+            self.btn_compute.setEnabled(True)
             try:
                 self.plot_cd.clear()
                 self.plot_q.clear()
@@ -581,18 +609,60 @@ class StepMeasurements(QWidget):
                         sb.showMessage("Błąd obliczeń (pomiń do czasu uzupełnienia danych)", 2500)
             except Exception:
                 pass
-            return
+        else:
+            if key is not None:
+                self._result_cache[key] = result
+                if len(self._result_cache) > self._RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+            if not self._compute_pending:
+                # A result superseded by a queued request is only cached; the rerun
+                # below draws it from the cache if the inputs turn out unchanged
+                self._last_compute_key = key
+                self._last_result = result
+                self._show_result(result, self._current_side(), t0)
+        if self._compute_pending:
+            self._compute_pending = False
+            self._recompute()
+
+    def _compute_key(self, prefs: Any) -> Optional[Tuple[Any, ...]]:
+        """Fingerprint of everything run_all sees here; None if it cannot be hashed."""
+        s = self.state
+        try:
+            key = (
+                tuple(tuple(sorted(r.items())) for r in s.measure_intake),
+                tuple(tuple(sorted(r.items())) for r in s.measure_exhaust),
+                s.air,
+                s.engine,
+                s.geometry,
+                s.csa_min_m2,
+                s.csa_avg_m2,
+                s.air_dp_ref_inH2O,
+                s.meta.get("mode"),
+                prefs.dp_ref_inH2O,
+                prefs.a_ref_mode,
+                prefs.eff_mode,
+            )
+            hash(key)
+        except TypeError:  # pragma: no cover - unhashable row values
+            return None
+        return key
+
+    def _show_result(self, result: Dict[str, Any], side: str, t0: float) -> None:
+        self._last_plot_side = side
         series = result.get("series", {})
-        active_idx = self.tabs.currentIndex()
-        side = "intake" if active_idx == 0 else "exhaust"
         data: List[Dict[str, Any]] = series.get(side, [])  # type: ignore[assignment]
 
-        self.plot_cd.clear()
-        self.plot_q.clear()
-        lifts_m = [float(d.get("lift_m") or 0.0) for d in data]
-        lifts_mm = [v * 1000.0 for v in lifts_m]
-        cd = [float(d.get("Cd_ref") or 0.0) for d in data]
-        q_cfm = [float(d.get("q_m3s_ref") or 0.0) * 2118.8800032893 for d in data]
+        # One (N, 3) pass over the series (a missing Cd/Q becomes NaN, which also counts
+        # the points that have one), then unit conversions on the columns
+        arr = np.fromiter(
+            ((d.get("lift_m") or 0.0, d.get("Cd_ref"), d.get("q_m3s_ref")) for d in data),
+            dtype=_ROW3,
+            count=len(data),
+        )
+        n_cd, n_q = np.count_nonzero(~np.isnan(arr[:, 1:]), axis=0).tolist()
+        lifts_mm = arr[:, 0] * 1000.0
+        cd = arr[:, 1]
+        q_cfm = arr[:, 2] * 2118.8800032893
         a_key = (result.get("params", {}).get("A_ref_key") or "eff") if isinstance(result, dict) else "eff"
         try:
             dp_ref = float(result.get("params", {}).get("dp_ref_inH2O", 28.0))  # type: ignore[assignment]
@@ -603,24 +673,19 @@ class StepMeasurements(QWidget):
         title_q = f"{side_prefix} · Q* @ {a_key} ΔP={dp_ref:.0f}\" H₂O"
         self.plot_cd.set_readout_units("mm", "-")
         self.plot_q.set_readout_units("mm", "CFM")
-        if lifts_mm and any(v != 0.0 for v in cd):
-            self.plot_cd.plot_xy(lifts_mm, cd, label=f"{side_prefix}", xlabel="Lift [mm]", ylabel="Cd (-)", title=title_cd)
-        if lifts_mm and any(v != 0.0 for v in q_cfm):
-            self.plot_q.plot_xy(lifts_mm, q_cfm, label=f"{side_prefix}", xlabel="Lift [mm]", ylabel="Q* [CFM]", title=title_q)
+        # Persistent lines: after the first plot only data, title and legend label change
+        if n_cd:
+            self.plot_cd.update_line(lifts_mm, cd, label=side_prefix, xlabel="Lift [mm]", ylabel="Cd (-)", title=title_cd)
+        else:
+            self.plot_cd.clear()
+        if n_q:
+            self.plot_q.update_line(lifts_mm, q_cfm, label=side_prefix, xlabel="Lift [mm]", ylabel="Q* [CFM]", title=title_q)
+        else:
+            self.plot_q.clear()
         self.plot_cd.render()
         self.plot_q.render()
 
-        rho_ref = None
-        try:
-            from iop_flow import formulas as F
-
-            rho_ref = (
-                F.air_density(F.AirState(self.state.air.p_tot, self.state.air.T, self.state.air.RH))
-                if self.state.air
-                else None
-            )
-        except Exception:
-            rho_ref = None
+        rho_ref = self._rho_ref()
         params_txt = (
             f'dp_ref={self.state.air_dp_ref_inH2O:.1f}"H₂O, '
             f"ρ_ref={rho_ref:.4f} kg/m³, A_ref_mode=eff, eff_mode=smoothmin"
@@ -656,6 +721,16 @@ class StepMeasurements(QWidget):
             pass
         self._emit_valid()
 
+    def _rho_ref(self) -> Optional[float]:
+        """Air density for the current state.air (memoized per (p_tot, T, RH))."""
+        air = self.state.air
+        if not air:
+            return None
+        try:
+            return air_density_cached(air.p_tot, air.T, air.RH)
+        except Exception:
+            return None
+
     def _show_info(self) -> None:
         QMessageBox.information(
             self,
@@ -667,20 +742,16 @@ class StepMeasurements(QWidget):
         )
 
     def _compute_pitot(self) -> None:
-        from iop_flow import formulas as F
         try:
-            dp_in = float((self.ed_pit_dp.text() or "28.0").replace(",", "."))
-            tC = float((self.ed_pit_T.text() or "20.0").replace(",", "."))
-            C = float((self.ed_pit_C.text() or "1.0").replace(",", "."))
+            dp_in = parse_float_pl(self.ed_pit_dp.text() or "28.0")
+            tC = parse_float_pl(self.ed_pit_T.text() or "20.0")
+            C = parse_float_pl(self.ed_pit_C.text() or "1.0")
             dp_pa = F.in_h2o_to_pa(dp_in)
-            if self.state.air:
-                rho = F.air_density(
-                    F.AirState(self.state.air.p_tot, self.state.air.T, self.state.air.RH)
-                )
-            else:
+            rho = self._rho_ref()
+            if rho is None:
                 rho = 1.204
             V = F.velocity_pitot(dp_pa, rho, C)
-            Mach = V / F.speed_of_sound(F.C_to_K(tC))
+            Mach = V / _speed_of_sound_C(tC)
             self.lbl_pit_V.setText(f"V = {V:.1f} m/s")
             self.lbl_pit_Mach.setText(f"Mach = {Mach:.3f}")
         except Exception:
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from PySide6.QtCore import QTimer
 
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 from PySide6.QtCore import Signal
 from PySide6.QtWidgets import (
     QWidget,
@@ -13,12 +14,14 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QPushButton,
     QTabWidget,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
+    QAbstractItemView,
+    QHeaderView,
     QLabel,
 )
 
 from ..widgets.mpl_canvas import MplCanvas
+from .measure_model import PlanTableModel, batch_updates
 from .state import WizardState, parse_float_pl, gen_grid, set_plan_from_ui, is_valid_step_plan
 
 
@@ -64,12 +67,21 @@ class StepPlan(QWidget):
         root.addLayout(right, 1)
         self.tabs = QTabWidget(self)
         right.addWidget(self.tabs)
-        self.tbl_i = QTableWidget(self)
-        self.tbl_e = QTableWidget(self)
-        for tbl in (self.tbl_i, self.tbl_e):
-            tbl.setColumnCount(2)
-            tbl.setHorizontalHeaderLabels(["lift_mm", "dp_inH2O"])
-            tbl.setRowCount(0)
+        # Views over (lift, dp) array models: edits parse one cell, reads are vectorized
+        # and cached per model revision (see _read_table)
+        self._read_cache: Dict[Any, Tuple[int, Tuple[List[float], Dict[float, float]]]] = {}
+        # Curve labels currently on the plot; see _update_plot
+        self._plot_labels: Tuple[str, ...] = ()
+        self.model_i = PlanTableModel(self)
+        self.model_e = PlanTableModel(self)
+        self.tbl_i = QTableView(self)
+        self.tbl_e = QTableView(self)
+        for tbl, model in ((self.tbl_i, self.model_i), (self.tbl_e, self.model_e)):
+            tbl.setModel(model)
+            vh = tbl.verticalHeader()
+            vh.setSectionResizeMode(QHeaderView.Fixed)
+            vh.setDefaultSectionSize(tbl.fontMetrics().height() + 8)
+            tbl.setEditTriggers(QAbstractItemView.AllEditTriggers)
         self.tabs.addTab(self.tbl_i, "INT")
         self.tabs.addTab(self.tbl_e, "EXH")
 
@@ -83,12 +95,17 @@ class StepPlan(QWidget):
         self.btn_gen_e.clicked.connect(lambda: self._gen("exhaust"))
         self.btn_copy.clicked.connect(self._copy_int_to_exh)
         self.btn_clear.clicked.connect(self._clear)
-        self.tbl_i.itemChanged.connect(lambda *_: self._on_changed())
-        self.tbl_e.itemChanged.connect(lambda *_: self._on_changed())
-        self.chk_swirl.toggled.connect(lambda *_: self._on_changed())
+        # Bursts of cell edits are applied (read, plot, save) once
+        self._edit_timer = QTimer(self)
+        self._edit_timer.setSingleShot(True)
+        self._edit_timer.setInterval(50)
+        self._edit_timer.timeout.connect(self._apply_changes)
+        self.model_i.sig_edited.connect(self._on_changed)
+        self.model_e.sig_edited.connect(self._on_changed)
+        self.chk_swirl.toggled.connect(self._on_changed)
         # Prefill
         self._prefill_from_state()
-        self._on_changed()
+        self._apply_changes()
         QTimer.singleShot(0, self._auto_compute_once)
 
     def showEvent(self, event):  # type: ignore[override]
@@ -116,25 +133,17 @@ class StepPlan(QWidget):
         if g:
             vals = gen_grid(*g)
         # Fill with default dp from measured bench dp if available
-        tbl = self.tbl_i if side == "intake" else self.tbl_e
-        self._fill_table(tbl, vals)
-        # Apply default dp to empty dp cells
-        dp_default = self.state.air_dp_meas_inH2O or self.state.air_dp_ref_inH2O
-        if dp_default and dp_default > 0:
-            for r in range(tbl.rowCount()):
-                it_dp = tbl.item(r, 1)
-                if it_dp is None or not it_dp.text().strip():
-                    tbl.setItem(r, 1, QTableWidgetItem(f"{dp_default:.3f}"))
-        self._on_changed()
+        self._fill_table(self.model_i if side == "intake" else self.model_e, vals)
+        self._apply_changes()
 
     def _copy_int_to_exh(self) -> None:
-        self._fill_table(self.tbl_e, self._read_table(self.tbl_i)[0])
-        self._on_changed()
+        self._fill_table(self.model_e, self._read_table(self.model_i)[0])
+        self._apply_changes()
 
     def _clear(self) -> None:
-        self._fill_table(self.tbl_i, [])
-        self._fill_table(self.tbl_e, [])
-        self._on_changed()
+        self._fill_table(self.model_i, [])
+        self._fill_table(self.model_e, [])
+        self._apply_changes()
 
     def _prefill_from_state(self) -> None:
         li = list(self.state.plan_intake())
@@ -143,90 +152,93 @@ class StepPlan(QWidget):
             li = [float(x) for x in range(1, 10)]
         if not le:
             le = [float(x) for x in range(1, 10)]
-        self._fill_table(self.tbl_i, li)
-        self._fill_table(self.tbl_e, le)
-        # Fill dp where present in state
-        def _apply_dp(tbl: QTableWidget, side: str) -> None:
-            for r in range(tbl.rowCount()):
-                it_l = tbl.item(r, 0)
-                if not it_l:
-                    continue
-                try:
-                    lift = round(parse_float_pl(it_l.text()), 3)
-                except Exception:
-                    continue
-                dp = self.state.dp_for_point(side, lift)
-                if dp is not None:
-                    tbl.setItem(r, 1, QTableWidgetItem(f"{dp:.3f}"))
-        _apply_dp(self.tbl_i, "intake")
-        _apply_dp(self.tbl_e, "exhaust")
-
-
-    def _fill_table(self, tbl: QTableWidget, lifts: List[float]) -> None:
-        tbl.blockSignals(True)
-        try:
-            tbl.setRowCount(len(lifts))
-            for r, v in enumerate(lifts):
-                item_l = QTableWidgetItem(f"{v:.3f}")
-                # Pre-populate dp with measured bench dp if available
-                dp_default = self.state.air_dp_meas_inH2O or self.state.air_dp_ref_inH2O
-                item_dp = QTableWidgetItem(
-                    f"{dp_default:.3f}" if (dp_default and dp_default > 0) else ""
-                )
-                tbl.setItem(r, 0, item_l)
-                tbl.setItem(r, 1, item_dp)
-        finally:
-            tbl.blockSignals(False)
-
-    def _read_table(self, tbl: QTableWidget) -> Tuple[List[float], Dict[float, float]]:
-        lifts: List[float] = []
-        dp_map: Dict[float, float] = {}
-        for r in range(tbl.rowCount()):
-            l_item = tbl.item(r, 0)
-            d_item = tbl.item(r, 1)
-            if not l_item:
-                continue
-            try:
-                lift = round(parse_float_pl(l_item.text()), 3)
-            except Exception:
-                continue
-            lifts.append(lift)
-            if d_item and d_item.text().strip():
-                try:
-                    dp = parse_float_pl(d_item.text())
-                    if dp > 0:
-                        dp_map[lift] = dp
-                except Exception:
-                    pass
-        # sort and dedupe, keep last dp
-        lifts = sorted(set(lifts))
-        return lifts, dp_map
-
-    def _update_counts(self) -> None:
-        li, _ = self._read_table(self.tbl_i)
-        le, _ = self._read_table(self.tbl_e)
-        self.lbl_counts.setText(f"INT: {len(li)}, EXH: {len(le)}")
+        # dp where present in state, else the bench default
+        self._fill_table(
+            self.model_i, li, [self.state.dp_for_point("intake", round(v, 3)) for v in li]
+        )
+        self._fill_table(
+            self.model_e, le, [self.state.dp_for_point("exhaust", round(v, 3)) for v in le]
+        )
 
-    def _update_plot(self) -> None:
-        self.plot.clear()
+    def _fill_table(
+        self,
+        model: PlanTableModel,
+        lifts: List[float],
+        dps: Optional[List[Optional[float]]] = None,
+    ) -> None:
+        # Pre-populate dp with measured bench dp if available (one model reset, no edits)
+        dp_default = self.state.air_dp_meas_inH2O or self.state.air_dp_ref_inH2O
+        if not (dp_default and dp_default > 0):
+            dp_default = None
+        if dps is None:
+            dps = [None] * len(lifts)
+        # Cells show 3 decimals: store what is shown
+        view = self.tbl_i if model is self.model_i else self.tbl_e
+        with batch_updates(view):
+            model.set_rows(
+                [round(v, 3) for v in lifts],
+                [dp_default if d is None else d for d in dps],
+            )
+
+    def _read_table(self, model: PlanTableModel) -> Tuple[List[float], Dict[float, float]]:
+        # Snapshot per model revision: copy/apply/plot in one pass share a single read
+        hit = self._read_cache.get(model)
+        if hit is not None and hit[0] == model.revision:
+            return hit[1]
+        arr = model.array
+        ok = ~np.isnan(arr[:, 0])
+        # Python round, as dp_for_point and the session builders key lifts (np.round differs
+        # on x.xxx5 values)
+        lifts = [round(v, 3) for v in arr[ok, 0].tolist()]
+        # sort and dedupe, keep last dp (> 0 only; NaN compares False)
+        dp_map = {lift: dp for lift, dp in zip(lifts, arr[ok, 1].tolist()) if dp > 0}
+        out = (sorted(set(lifts)), dp_map)
+        self._read_cache[model] = (model.revision, out)
+        return out
+
+    def _update_plot(
+        self, li: Optional[List[float]] = None, le: Optional[List[float]] = None
+    ) -> None:
         g = self.state.geometry
-        li, _ = self._read_table(self.tbl_i)
-        le, _ = self._read_table(self.tbl_e)
+        if li is None:
+            li, _ = self._read_table(self.model_i)
+        if le is None:
+            le, _ = self._read_table(self.model_e)
+        # L/D = lift_mm / (1000 * valve_m): one vector multiply per side
+        curves: List[Tuple[str, np.ndarray, np.ndarray]] = []
         if g and li:
-            x = li
-            y_i = [(lift / 1000.0) / g.valve_int_m for lift in li]
-            self.plot.plot_xy(x, y_i, label="L/D INT")
+            x_i = np.asarray(li, dtype=np.float64)
+            curves.append(("L/D INT", x_i, x_i * (1.0 / (1000.0 * g.valve_int_m))))
         if g and le:
-            y_e = [(lift / 1000.0) / g.valve_exh_m for lift in le]
-            self.plot.plot_xy(le, y_e, label="L/D EXH")
+            x_e = np.asarray(le, dtype=np.float64)
+            curves.append(("L/D EXH", x_e, x_e * (1.0 / (1000.0 * g.valve_exh_m))))
+        # Same curves as last time: swap line data only; a side appearing/vanishing
+        # rebuilds the axis so the legend matches
+        labels = tuple(c[0] for c in curves)
+        if labels != self._plot_labels:
+            self.plot.clear()
+            self._plot_labels = labels
+        for label, x, y in curves:
+            self.plot.plot_or_update_line(label, x, y)
         self.plot.render()
 
-    def _on_changed(self) -> None:
-        self._update_counts()
-        self._update_plot()
+    def _on_changed(self, *_: object) -> None:
+        # Cell edits / swirl toggle: coalesced, see _apply_changes
+        self._edit_timer.start()
+
+    def hideEvent(self, event):  # type: ignore[override]
+        if self._edit_timer.isActive():
+            self._apply_changes()
+        super().hideEvent(event)
+
+    def _apply_changes(self) -> None:
+        # One read of each table feeds the counts, the plot and the saved plan
+        self._edit_timer.stop()
+        li, dpi = self._read_table(self.model_i)
+        le, dpe = self._read_table(self.model_e)
+        self.lbl_counts.setText(f"INT: {len(li)}, EXH: {len(le)}")
+        self._update_plot(li, le)
         # save into state
-        li, dpi = self._read_table(self.tbl_i)
-        le, dpe = self._read_table(self.tbl_e)
         dp_map: Dict[Tuple[str, float], float] = {}
         for lift, v in dpi.items():
             dp_map[("intake", lift)] = v
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
-from PySide6.QtCore import QSettings
+from PySide6.QtCore import QSettings, QSignalBlocker, QThreadPool, QTimer
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -20,9 +21,13 @@ from PySide6.QtWidgets import (
 import json
 import io
 import csv
+import math
 import os
+import re
 from pathlib import Path
 
+import numpy as np
+
 from iop_flow.api import run_all
 from iop_flow.io_json import write_session
 from iop_flow import formulas as F
@@ -30,8 +35,37 @@ from iop_flow.hp import (
     hp_from_cfm,
     estimate_hp_curve_mode_b,
 )
+from iop_flow.tuning import quarter_wave_L_phys, quarter_wave_rpm_for_L, helmholtz_f_and_rpm
+
+from .compute_task import RunAllTask
+from .state import WizardState, air_density_cached, parse_float_pl
+
+
+def _pf(text: str, default: float) -> float:
+    # HP-pane field value; default for empty, malformed or non-finite (inf/nan) input
+    try:
+        v = parse_float_pl(text)
+    except ValueError:
+        return default
+    return v if math.isfinite(v) else default
+
+
+@lru_cache(maxsize=256)
+def _tuning_calc(
+    L_mm: float, D_mm: float, V_plenum_cc: float, n_harm: int, T_K: float, rpm_target: float
+) -> Tuple[float, float, float, float, float]:
+    """(L_recommended [m], rpm_for_L, f_H [Hz], rpm_helm, a [m/s]) for the tuning panel."""
+    L_m = L_mm / 1000.0
+    D_m = D_mm / 1000.0
+    L_recommended = quarter_wave_L_phys(rpm_target, n_harm, D_m, T_K)
+    rpm_for_L = quarter_wave_rpm_for_L(L_m, n_harm, D_m, T_K)
+    f_H, rpm_helm = helmholtz_f_and_rpm(D_m, L_m, V_plenum_cc * 1e-6, n_harm, T_K)
+    return L_recommended, rpm_for_L, f_H, rpm_helm, F.speed_of_sound(T_K)
+
 
-from .state import WizardState
+_CSV_HEADERS = ["lift_m", "q_m3s_ref", "A_ref_key", "Cd_ref", "V_ref", "Mach_ref", "SR"]
+# Cells csv.writer would quote (QUOTE_MINIMAL with the default dialect)
+_CSV_SPECIAL = re.compile(r'[,"\r\n]')
 
 
 class StepReport(QWidget):
@@ -39,6 +73,12 @@ class StepReport(QWidget):
         super().__init__()
         self.state = state
         self.settings = QSettings("iop-flow", "wizard")
+        # (input fingerprint, run_all output) of the last _compute; see _compute_key
+        self._compute_cache: Tuple[Optional[Tuple[Any, ...]], Optional[Dict[str, Any]]] = (None, None)
+        # Background run_all for _refresh: one task at a time, a refresh while busy reruns after it
+        self._busy = False
+        self._refresh_pending = False
+        self._task: Optional[RunAllTask] = None
 
         root = QVBoxLayout(self)
         self.lbl_stats = QLabel("—", self)
@@ -155,6 +195,7 @@ class StepReport(QWidget):
         # --- Tuning (expanded) ---
         from PySide6.QtWidgets import QComboBox
         tuning_box = QGroupBox("Tuning", self)
+        self.tuning_box = tuning_box
         tuning_lay = QVBoxLayout(tuning_box)
 
         # Prefill from state or defaults
@@ -275,46 +316,23 @@ class StepReport(QWidget):
         self.btn_save_results.clicked.connect(self._save_results)
         self.btn_export_csv.clicked.connect(self._export_csv)
 
-        # --- All signal connections and initial sync at the end of __init__ ---
-        self.spn_L_mm.valueChanged.connect(self._on_tuning_changed)
-        self.spn_D_mm.valueChanged.connect(self._on_tuning_changed)
-        self.spn_V_plenum_cc.valueChanged.connect(self._on_tuning_changed)
-        self.cmb_n_harm.currentIndexChanged.connect(self._on_tuning_changed)
-        self.spn_afr.valueChanged.connect(self._on_tuning_changed)
-        self.spn_bsfc.valueChanged.connect(self._on_tuning_changed)
-
-        for w in (
-            self.rb_mode_a,
-            self.rb_mode_b,
-            self.ed_rpm_start,
-            self.ed_rpm_stop,
-            self.ed_rpm_step,
-            self.ed_cfm_per_hp,
-            self.ed_afr,
-            self.ed_lambda,
-            self.ed_bsfc,
-            self.rb_rho_bench,
-            self.rb_rho_fixed,
-            self.ed_loss_pct,
-        ):
-            try:
-                w.clicked.connect(self._refresh)  # type: ignore[attr-defined]
-            except Exception:
-                try:
-                    w.textChanged.connect(self._refresh)  # type: ignore[attr-defined]
-                except Exception:
-                    pass
-
-        self._sync_tuning_from_state()
-        self._refresh()
+        # Typing/spinning coalesces: one refresh / tuning save per 150 ms burst
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(150)
+        self._refresh_timer.timeout.connect(self._refresh)
+        self._tuning_timer = QTimer(self)
+        self._tuning_timer.setSingleShot(True)
+        self._tuning_timer.setInterval(150)
+        self._tuning_timer.timeout.connect(self._on_tuning_changed)
 
         # --- All signal connections and initial sync at the end of __init__ ---
-        self.spn_L_mm.valueChanged.connect(self._on_tuning_changed)
-        self.spn_D_mm.valueChanged.connect(self._on_tuning_changed)
-        self.spn_V_plenum_cc.valueChanged.connect(self._on_tuning_changed)
-        self.cmb_n_harm.currentIndexChanged.connect(self._on_tuning_changed)
-        self.spn_afr.valueChanged.connect(self._on_tuning_changed)
-        self.spn_bsfc.valueChanged.connect(self._on_tuning_changed)
+        self.spn_L_mm.valueChanged.connect(self._schedule_tuning)
+        self.spn_D_mm.valueChanged.connect(self._schedule_tuning)
+        self.spn_V_plenum_cc.valueChanged.connect(self._schedule_tuning)
+        self.cmb_n_harm.currentIndexChanged.connect(self._schedule_tuning)
+        self.spn_afr.valueChanged.connect(self._schedule_tuning)
+        self.spn_bsfc.valueChanged.connect(self._schedule_tuning)
 
         for w in (
             self.rb_mode_a,
@@ -331,61 +349,79 @@ class StepReport(QWidget):
             self.ed_loss_pct,
         ):
             try:
-                w.clicked.connect(self._refresh)  # type: ignore[attr-defined]
+                w.clicked.connect(self._schedule_refresh)  # type: ignore[attr-defined]
             except Exception:
                 try:
-                    w.textChanged.connect(self._refresh)  # type: ignore[attr-defined]
+                    w.textChanged.connect(self._schedule_refresh)  # type: ignore[attr-defined]
                 except Exception:
                     pass
 
         self._sync_tuning_from_state()
         self._refresh()
 
+    def _schedule_refresh(self, *_: Any) -> None:
+        self._refresh_timer.start()
 
+    def _schedule_tuning(self, *_: Any) -> None:
+        self._tuning_timer.start()
 
+    def _flush_pending(self) -> None:
+        """Bring stats/HP up to date synchronously (before saving files)."""
+        if self._tuning_timer.isActive():
+            self._tuning_timer.stop()
+            self._on_tuning_changed()
+        if self._refresh_timer.isActive() or self._busy or self._refresh_pending:
+            self._refresh_timer.stop()
+            self._refresh_pending = False
+            try:
+                data = self._compute()
+                self._show_out(data["session"], data["out"])
+            except Exception as e:
+                self.lbl_stats.setText(f"Błąd obliczeń: {e}")
+
+    def hideEvent(self, event):  # type: ignore[override]
+        # Leaving the step: save tuning now; a pending refresh still runs in the background
+        if self._tuning_timer.isActive():
+            self._tuning_timer.stop()
+            self._on_tuning_changed()
+        if self._refresh_timer.isActive():
+            self._refresh_timer.stop()
+            self._refresh()
+        super().hideEvent(event)
 
     def _sync_tuning_from_state(self) -> None:
         """Load tuning values from state into widgets (no signal cascade)."""
         try:
             d = self.state.tuning.get("intake_calc", {})
-            if isinstance(d, dict):
-                # L_mm
-                L = d.get("L_mm")
-                if L is not None:
-                    self.spn_L_mm.blockSignals(True)
-                    self.spn_L_mm.setValue(float(L))
-                    self.spn_L_mm.blockSignals(False)
-                # D_mm
-                D = d.get("D_mm")
-                if D is not None:
-                    self.spn_D_mm.blockSignals(True)
-                    self.spn_D_mm.setValue(float(D))
-                    self.spn_D_mm.blockSignals(False)
-                # V_plenum_cc
-                V = d.get("V_plenum_cc")
-                if V is not None:
-                    self.spn_V_plenum_cc.blockSignals(True)
-                    self.spn_V_plenum_cc.setValue(float(V))
-                    self.spn_V_plenum_cc.blockSignals(False)
-                # n_harm
+            if not isinstance(d, dict):
+                return
+            widgets = (
+                self.spn_L_mm,
+                self.spn_D_mm,
+                self.spn_V_plenum_cc,
+                self.cmb_n_harm,
+                self.spn_afr,
+                self.spn_bsfc,
+            )
+            # One blocker per widget for the whole sync; released when the list goes away
+            blockers = [QSignalBlocker(w) for w in widgets]  # noqa: F841
+            self.tuning_box.setUpdatesEnabled(False)
+            try:
+                for spn, key in (
+                    (self.spn_L_mm, "L_mm"),
+                    (self.spn_D_mm, "D_mm"),
+                    (self.spn_V_plenum_cc, "V_plenum_cc"),
+                    (self.spn_afr, "afr"),
+                    (self.spn_bsfc, "bsfc"),
+                ):
+                    v = d.get(key)
+                    if v is not None:
+                        spn.setValue(float(v))
                 n = d.get("n_harm")
                 if n is not None:
-                    idx = max(0, min(2, int(n) - 1))
-                    self.cmb_n_harm.blockSignals(True)
-                    self.cmb_n_harm.setCurrentIndex(idx)
-                    self.cmb_n_harm.blockSignals(False)
-                # afr
-                afr = d.get("afr")
-                if afr is not None:
-                    self.spn_afr.blockSignals(True)
-                    self.spn_afr.setValue(float(afr))
-                    self.spn_afr.blockSignals(False)
-                # bsfc
-                bsfc = d.get("bsfc")
-                if bsfc is not None:
-                    self.spn_bsfc.blockSignals(True)
-                    self.spn_bsfc.setValue(float(bsfc))
-                    self.spn_bsfc.blockSignals(False)
+                    self.cmb_n_harm.setCurrentIndex(max(0, min(2, int(n) - 1)))
+            finally:
+                self.tuning_box.setUpdatesEnabled(True)
         except Exception:
             pass
 
@@ -406,16 +442,11 @@ class StepReport(QWidget):
     def _recompute_tuning_calcs(self) -> None:
         """Recompute and update tuning calculators and status line."""
         try:
-            from iop_flow.tuning import quarter_wave_L_phys, quarter_wave_rpm_for_L, helmholtz_f_and_rpm
             # Gather inputs
             L_mm = float(self.spn_L_mm.value())
             D_mm = float(self.spn_D_mm.value())
             V_plenum_cc = float(self.spn_V_plenum_cc.value())
             n_harm = int(self.cmb_n_harm.currentText())
-            # SI units
-            L_m = L_mm / 1000.0
-            D_m = D_mm / 1000.0
-            V_plenum_m3 = V_plenum_cc * 1e-6
             # Get T_K from state (Bench & Air) or fallback
             T_K = 293.15
             try:
@@ -430,18 +461,16 @@ class StepReport(QWidget):
                     rpm_target = float(self.state.engine_target_rpm)
             except Exception:
                 pass
-            # Compute
-            L_recommended = quarter_wave_L_phys(rpm_target, n_harm, D_m, T_K)
-            rpm_for_L = quarter_wave_rpm_for_L(L_m, n_harm, D_m, T_K)
-            f_H, rpm_helm = helmholtz_f_and_rpm(D_m, L_m, V_plenum_m3, n_harm, T_K)
+            # Compute (memoized: HP-field edits refresh with the same inputs)
+            L_recommended, rpm_for_L, f_H, rpm_helm, a = _tuning_calc(
+                L_mm, D_mm, V_plenum_cc, n_harm, T_K, rpm_target
+            )
             # Display (rounded)
             self.lbl_L_recommended.setText(f"{L_recommended*1000:.0f}")
             self.lbl_rpm_for_L.setText(f"{round(rpm_for_L/10)*10:.0f}")
             self.lbl_helmholtz_f.setText(f"{f_H:.1f}")
             self.lbl_helmholtz_rpm.setText(f"{round(rpm_helm/10)*10:.0f}")
             # Status line
-            from iop_flow import formulas as F
-            a = F.speed_of_sound(T_K)
             self.lbl_tuning_status.setText(f"a(T)={a:.1f} m/s, n={n_harm}, rpm_target={rpm_target:.0f}")
         except Exception as e:
             self.lbl_L_recommended.setText("—")
@@ -461,21 +490,89 @@ class StepReport(QWidget):
             pass
 
     def _compute(self) -> Dict[str, Any]:
+        """
+        Session and run_all output for the current state. The session is always rebuilt
+        (cheap, and saved as-is); run_all is reused while the inputs are unchanged, so
+        _refresh cascades and the save/export buttons do not recompute it.
+        """
         session = self.state.build_session_for_run_all()
-        out = run_all(
-            session,
-            dp_ref_inH2O=self.state.air_dp_ref_inH2O,
-            engine_v_target=(self.state.engine_v_target or 100.0),
-        )
+        key = self._compute_key()
+        cached_key, out = self._compute_cache
+        if key is None or key != cached_key or out is None:
+            out = run_all(session, **self._run_all_kwargs())
+            self._compute_cache = (key, out)
         return {"session": session, "out": out}
 
+    def _run_all_kwargs(self) -> Dict[str, Any]:
+        return {
+            "dp_ref_inH2O": self.state.air_dp_ref_inH2O,
+            "engine_v_target": (self.state.engine_v_target or 100.0),
+        }
+
+    def _compute_key(self) -> Optional[Tuple[Any, ...]]:
+        """Fingerprint of everything _compute feeds run_all; None if it cannot be hashed."""
+        s = self.state
+        try:
+            key = (
+                tuple(tuple(sorted(r.items())) for r in s.measure_intake),
+                tuple(tuple(sorted(r.items())) for r in s.measure_exhaust),
+                tuple(sorted(s.meta.items())),
+                s.air,
+                s.engine,
+                s.geometry,
+                s.csa_min_m2,
+                s.csa_avg_m2,
+                s.air_dp_ref_inH2O,
+                s.engine_v_target,
+            )
+            hash(key)
+        except TypeError:  # pragma: no cover - unhashable row/meta values
+            return None
+        return key
+
     def _refresh(self) -> None:
         try:
             # Ensure UI reflects latest state.tuning if it changed elsewhere
             self._sync_tuning_from_state()
             self._recompute_tuning_calcs()
-            data = self._compute()
-            out = data["out"]
+            key = self._compute_key()
+            cached_key, out = self._compute_cache
+            if key is not None and key == cached_key and out is not None:
+                self._show_out(self.state.build_session_for_run_all(), out)
+                return
+            if self._busy:
+                self._refresh_pending = True
+                return
+            session = self.state.build_session_for_run_all()
+        except Exception as e:
+            self.lbl_stats.setText(f"Błąd obliczeń: {e}")
+            return
+        # run_all off the GUI thread; _on_run_all_finished caches and shows the result
+        self._busy = True
+        task = RunAllTask(session, self._run_all_kwargs(), (key, session))
+        task.signals.finished.connect(self._on_run_all_finished)
+        self._task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_run_all_finished(self, token: Any, result: Any) -> None:
+        key, session = token
+        self._busy = False
+        self._task = None
+        if isinstance(result, Exception):
+            self._compute_cache = (None, None)
+        else:
+            self._compute_cache = (key, result)
+        if self._refresh_pending:
+            # Superseded: the rerun shows this result from the cache if inputs are unchanged
+            self._refresh_pending = False
+            self._refresh()
+        elif isinstance(result, Exception):
+            self.lbl_stats.setText(f"Błąd obliczeń: {result}")
+        else:
+            self._show_out(session, result)
+
+    def _show_out(self, session: Any, out: Dict[str, Any]) -> None:
+        try:
             series = out.get("series", {})
             ei = series.get("ei", [])
             vals = [e.get("EI") for e in ei if e.get("EI") is not None]
@@ -489,7 +586,7 @@ class StepReport(QWidget):
             self.lbl_stats.setText("; ".join(txt) if txt else "—")
 
             # HP compute and plot
-            self._compute_and_plot_hp(data["session"], out)
+            self._compute_and_plot_hp(session, out)
         except Exception as e:
             self.lbl_stats.setText(f"Błąd obliczeń: {e}")
 
@@ -501,6 +598,7 @@ class StepReport(QWidget):
         if not path:
             return
         self.settings.setValue("last_dir", os.path.dirname(path))
+        self._flush_pending()
         data = self._compute()["session"]
         try:
             write_session(Path(path), data)
@@ -521,6 +619,7 @@ class StepReport(QWidget):
         if not path:
             return
         self.settings.setValue("last_dir", os.path.dirname(path))
+        self._flush_pending()
         env = self._compute()
         out = env["out"]
         # Ensure HP section is included
@@ -573,12 +672,30 @@ class StepReport(QWidget):
         with io.open(path, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
 
+    @staticmethod
+    def _write_csv(path: str, headers: List[str], rows: List[List[Any]]) -> None:
+        # Same bytes as csv.writer (utf-8-sig, CRLF, None -> ""), preformatted and written in
+        # one buffered pass; csv.writer only handles the quoting when a cell needs it.
+        cells = [["" if v is None else str(v) for v in row] for row in rows]
+        with open(path, "wb", buffering=1 << 20) as f:
+            f.write(b"\xef\xbb\xbf")
+            if any(_CSV_SPECIAL.search(c) for row in cells for c in row):
+                text = io.StringIO(newline="")
+                writer = csv.writer(text)
+                writer.writerow(headers)
+                writer.writerows(cells)
+                f.write(text.getvalue().encode("utf-8"))
+                return
+            f.write((",".join(headers) + "\r\n").encode("utf-8"))
+            f.writelines((",".join(row) + "\r\n").encode("utf-8") for row in cells)
+
     def _export_csv(self) -> None:
         last_dir = self.settings.value("last_dir", "", type=str) or ""
         dir_path = QFileDialog.getExistingDirectory(self, "Wybierz katalog", last_dir)
         if not dir_path:
             return
         self.settings.setValue("last_dir", dir_path)
+        self._flush_pending()
         data = self._compute()
         out = data["out"]
         series = out.get("series", {})
@@ -587,43 +704,17 @@ class StepReport(QWidget):
             if not rows:
                 continue
             csv_path = os.path.join(dir_path, f"{side}.csv")
-            with open(csv_path, "w", newline="", encoding="utf-8-sig") as f:
-                writer = csv.writer(f)
-                headers = ["lift_m", "q_m3s_ref", "A_ref_key", "Cd_ref", "V_ref", "Mach_ref", "SR"]
-                writer.writerow(headers)
-                for r in rows:
-                    writer.writerow(
-                        [
-                            r.get("lift_m"),
-                            r.get("q_m3s_ref"),
-                            r.get("A_ref_key"),
-                            r.get("Cd_ref"),
-                            r.get("V_ref"),
-                            r.get("Mach_ref"),
-                            r.get("SR") if r.get("SR") is not None else "",
-                        ]
-                    )
+            self._write_csv(csv_path, _CSV_HEADERS, [[r.get(k) for k in _CSV_HEADERS] for r in rows])
         QMessageBox.information(self, "Eksport", f"Zapisano CSV do: {dir_path}")
         self._status_ok()
 
     # ----------------- HP helpers -----------------
-    def _rpm_grid(self) -> list[float]:
-        def _p(ed: QLineEdit, dv: float) -> float:
-            s = (ed.text() or "").strip()
-            try:
-                return float(s.replace(",", "."))
-            except Exception:
-                return dv
-
-        start = max(0.0, _p(self.ed_rpm_start, 1000.0))
-        stop = max(start, _p(self.ed_rpm_stop, 9000.0))
-        step = max(1.0, _p(self.ed_rpm_step, 500.0))
-        vals: list[float] = []
-        v = start
-        while v <= stop + 1e-9:
-            vals.append(round(v, 3))
-            v += step
-        return vals
+    def _rpm_grid(self) -> np.ndarray:
+        start = max(0.0, _pf(self.ed_rpm_start.text(), 1000.0))
+        stop = max(start, _pf(self.ed_rpm_stop.text(), 9000.0))
+        step = max(1.0, _pf(self.ed_rpm_step.text(), 500.0))
+        n = int((stop - start + 1e-9) // step) + 1
+        return np.round(start + step * np.arange(n, dtype=np.float64), 3)
 
     def _compute_and_plot_hp(self, session, out: dict) -> None:
         # Limits
@@ -631,8 +722,7 @@ class StepReport(QWidget):
         rpm_csa = (out.get("engine", {}) or {}).get("rpm_from_csa")
         # Mode
         mode = "A" if self.rb_mode_a.isChecked() else "B"
-        xs: list[float] = []
-        ys: list[float] = []
+        xs = ys = np.empty(0)
         peak_hp = 0.0
         peak_rpm = 0.0
         params: dict[str, Any] = {}
@@ -644,17 +734,14 @@ class StepReport(QWidget):
             dp_ref = self.state.air_dp_ref_inH2O
         rho_ref = None
         try:
-            rho_ref = F.air_density(F.AirState(self.state.air.p_tot, self.state.air.T, self.state.air.RH)) if self.state.air else None
+            air = self.state.air
+            rho_ref = air_density_cached(air.p_tot, air.T, air.RH) if air else None
         except Exception:
             rho_ref = None
 
         # Common loss factor
         def _loss_factor() -> float:
-            try:
-                p = float((self.ed_loss_pct.text() or "0").replace(",", "."))
-                return max(0.0, min(0.99, p / 100.0))
-            except Exception:
-                return 0.0
+            return max(0.0, min(0.99, _pf(self.ed_loss_pct.text(), 0.0) / 100.0))
 
         loss = _loss_factor()
         if mode == "A":
@@ -669,12 +756,12 @@ class StepReport(QWidget):
                 q_peak_cfm = (max(q_m3s) if q_m3s else 0.0) * F.M3S_TO_CFM
                 cyl = getattr(session.engine, "cylinders", 4) or 4
                 cfm_total = q_peak_cfm * float(cyl)
-                cfm_per_hp = float((self.ed_cfm_per_hp.text() or "3.9").replace(",", "."))
+                cfm_per_hp = _pf(self.ed_cfm_per_hp.text(), 3.9)
                 hp_tot = hp_from_cfm(cfm_total, cfm_per_hp)
                 hp_tot *= (1.0 - loss)
                 xs = self._rpm_grid()
-                ys = [hp_tot for _ in xs]
-                peak_hp, peak_rpm = (hp_tot, xs[len(xs)//2] if xs else 0.0)
+                ys = np.full_like(xs, hp_tot, dtype=np.float64)
+                peak_hp, peak_rpm = (hp_tot, float(xs[len(xs)//2]) if len(xs) else 0.0)
                 params = {
                     "mode": "A",
                     "cfm_per_hp": cfm_per_hp,
@@ -684,16 +771,16 @@ class StepReport(QWidget):
                     "loss_frac": loss,
                 }
             except Exception:
-                xs, ys = [], []
+                xs = ys = np.empty(0)
         else:
             # Physical model
             try:
-                afr = float((self.ed_afr.text() or "12.8").replace(",", "."))
-                lam = float((self.ed_lambda.text() or "1.0").replace(",", "."))
-                bsfc = float((self.ed_bsfc.text() or "0.5").replace(",", "."))
+                afr = _pf(self.ed_afr.text(), 12.8)
+                lam = _pf(self.ed_lambda.text(), 1.0)
+                bsfc = _pf(self.ed_bsfc.text(), 0.5)
                 grid = self._rpm_grid()
                 cap = None
-                if grid:
+                if len(grid):
                     cap = min(
                         [v for v in [rpm_flow or float("inf"), rpm_csa or float("inf"), max(grid)] if v is not None]
                     )
@@ -708,8 +795,8 @@ class StepReport(QWidget):
                     rho_fixed=1.204,
                     rpm_cap=cap,
                 )
-                xs = list(res["rpm"])
-                ys = [v * (1.0 - loss) if (v == v) else v for v in res["hp"]]
+                xs = np.asarray(res["rpm"], dtype=np.float64)
+                ys = np.asarray(res["hp"], dtype=np.float64) * (1.0 - loss)
                 peak_hp, peak_rpm = res["peak"]
                 params = {
                     "mode": "B",
@@ -720,11 +807,11 @@ class StepReport(QWidget):
                     "loss_frac": loss,
                 }
             except Exception:
-                xs, ys = [], []
+                xs = ys = np.empty(0)
 
         # Plot
         self.plot_hp.clear()
-        if xs and ys:
+        if len(xs) and len(ys):
             self.plot_hp.plot_xy(xs, ys, label=("ROT" if mode == "A" else "BSFC/AFR"), xlabel="RPM", ylabel="HP [–]", title="Moc szacowana")
             # vertical limits
             try:
@@ -757,8 +844,8 @@ class StepReport(QWidget):
                 },
             }
             # include curve if not too large
-            if xs and ys and len(xs) <= 1000:
-                hp_meta["curve"] = {"rpm": xs, "hp": ys}
+            if len(xs) and len(ys) and len(xs) <= 1000:
+                hp_meta["curve"] = {"rpm": xs.tolist(), "hp": ys.tolist()}
             self.state.results["hp"] = hp_meta
         except Exception:
             pass
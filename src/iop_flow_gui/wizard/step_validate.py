@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from operator import itemgetter
 from typing import Any, List, Dict, Optional
 
 from PySide6.QtCore import Signal
@@ -19,6 +20,8 @@ from iop_flow.engine_link import mach_at_min_csa_for_series
 
 from .state import WizardState
 
+_get_q_ref = itemgetter("q_m3s_ref")
+
 
 class StepValidate(QWidget):
     sig_valid_changed = Signal(bool)
@@ -212,7 +215,10 @@ class StepValidate(QWidget):
                 try:
                     series_intake = (out.get("series", {}) or {}).get("intake", [])
                     if series_intake:
-                        q_peak_m3s = max(float(r.get("q_m3s_ref") or 0.0) for r in series_intake)
+                        q_peak_m3s = max(
+                            (float(v) for v in map(_get_q_ref, series_intake) if v is not None),
+                            default=0.0,
+                        )
                         q_peak_cfm = q_peak_m3s * 2118.880003  # M3S_TO_CFM
                         cyl = getattr(self.state.engine, "cylinders", 4) if self.state.engine else 4
                         self._add_item(
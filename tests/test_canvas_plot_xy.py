@@ -1,5 +1,23 @@
 from __future__ import annotations
 
+import pytest
+
+
+@pytest.fixture
+def canvas():
+    # Headless setup: Matplotlib non-interactive and Qt offscreen
+    import os
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    import matplotlib
+    matplotlib.use("Agg", force=True)
+    from PySide6.QtWidgets import QApplication
+    _ = QApplication.instance() or QApplication([])
+
+    from iop_flow_gui.widgets.mpl_canvas import MplCanvas
+
+    return MplCanvas()
+
+
 def test_mplcanvas_plot_xy_smoke(monkeypatch):
     # Headless setup: Matplotlib non-interactive and Qt offscreen
     import os
@@ -20,3 +38,68 @@ def test_mplcanvas_plot_xy_smoke(monkeypatch):
 
     # If no exception, consider pass; additionally check figure has axes
     assert hasattr(c, "fig") and len(c.fig.axes) >= 1
+
+
+def test_mplcanvas_update_line_reuses_artist(canvas):
+    c = canvas
+    c.update_line([0, 1], [0.0, 1.0], label="a", title="T1")
+    line = c.ax.lines[0]
+    c.update_line([0, 1, 2], [0.0, 1.0, 4.0], label="a", title="T2")
+    assert list(c.ax.lines) == [line]
+    assert list(line.get_xdata()) == [0, 1, 2]
+    assert c.ax.get_title() == "T2" and c.last_points_count == 3
+    assert c.ax.get_ylim()[1] >= 4.0
+    c.update_line([0, 1], [0.0, 2.0], label="b")
+    assert list(c.ax.lines) == [line]
+    assert [t.get_text() for t in c.ax.get_legend().get_texts()] == ["b"]
+    c.clear()
+    c.update_line([0], [1.0])
+    assert len(c.ax.lines) == 1 and c.ax.lines[0] is not line
+    c.render()
+
+
+def test_mplcanvas_plot_or_update_line_keeps_one_line_per_label(canvas):
+    def data_lines(c):  # skip the cursor's own (underscore-labelled) lines
+        return [ln for ln in c.ax.lines if not ln.get_label().startswith("_")]
+
+    c = canvas
+    c.plot_or_update_line("INT", [0, 1], [0.0, 1.0])
+    c.plot_or_update_line("EXH", [0, 1], [0.0, 2.0])
+    first = data_lines(c)
+    assert [ln.get_label() for ln in first] == ["INT", "EXH"]
+    c.plot_or_update_line("EXH", [0, 1], [0.0, 5.0])
+    assert data_lines(c) == first
+    assert c.ax.get_ylim()[1] >= 5.0
+    c.clear()
+    c.plot_or_update_line("INT", [0], [1.0])
+    assert len(data_lines(c)) == 1 and data_lines(c)[0] is not first[0]
+    c.render()
+
+
+def test_mplcanvas_set_vline_moves_single_marker(canvas):
+    c = canvas
+    c.plot_or_update_line("INT", [0, 10], [0.0, 1.0])
+    n = len(c.ax.lines)
+    c.set_vline(2.0)
+    marker = c.ax.lines[-1]
+    c.set_vline(5.0)
+    assert len(c.ax.lines) == n + 1 and c.ax.lines[-1] is marker
+    assert list(marker.get_xdata()) == [5.0, 5.0]
+    c.clear()
+    c.set_vline(1.0)
+    assert c.ax.lines[-1] is not marker
+    c.render()
+
+
+def test_mplcanvas_update_curves_single_collection(canvas):
+    c = canvas
+    c.update_curves([0, 1, 2], ([0.0, 1.0, 2.0], [0.0, 2.0, 4.0]), ("INT", "EXH"))
+    lc = c.ax.collections[0]
+    assert len(lc.get_segments()) == 2
+    assert [t.get_text() for t in c.ax.get_legend().get_texts()] == ["INT", "EXH"]
+    c.update_curves([0, 1, 2], ([0.0, 1.0, 2.0], [0.0, 5.0, 10.0]), ("INT", "EXH"))
+    assert list(c.ax.collections) == [lc]
+    assert c.ax.get_ylim()[1] >= 10.0
+    c.update_curves([0, 1, 2], ([0.0, 0.1, 0.2], [0.0, 0.2, 0.3]), ("INT", "EXH"))
+    assert c.ax.get_ylim()[1] < 1.0  # limits follow the data down as well
+    c.render()
@@ -13,3 +13,9 @@ def test_import_step_exhaust_smoke():
 
     # Class must exist; import must not print or block
     assert hasattr(mod, "StepExhaust")
+
+
+def test_step_exhaust_defined_once():
+    src = pathlib.Path("src/iop_flow_gui/wizard/step_exhaust.py").read_text(encoding="utf-8")
+    assert src.count("class StepExhaust(") == 1
+    assert src.count("__all__ =") == 1
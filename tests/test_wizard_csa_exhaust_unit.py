@@ -120,3 +120,16 @@ def test_ei_threshold_boundaries_no_alert() -> None:
     # average is (0.70 + 0.85)/2 = 0.775 within bounds
     m = mean(vals)
     assert 0.70 <= m <= 0.85
+
+
+def test_exhaust_q_peak_from_rows_matches_run_all() -> None:
+    from iop_flow_gui.wizard.step_exhaust import _q_peak_from_rows, _q_peak_m3s
+
+    s = WizardState()
+    s.apply_defaults_preset()
+    s.measure_exhaust[-1]["dp_inH2O"] = 10.0  # off-reference dp on the peak row
+    dp_ref = s.air_dp_ref_inH2O or 28.0
+    out = run_all(s.build_session_for_run_all(), dp_ref_inH2O=dp_ref)
+    expected = _q_peak_m3s(out["series"]["exhaust"])
+    assert expected > 0.0
+    assert abs(_q_peak_from_rows(s.measure_exhaust, dp_ref) - expected) < 1e-12
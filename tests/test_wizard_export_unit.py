@@ -87,3 +87,26 @@ def test_export_json_and_csv_like() -> None:
             lines = [ln for ln in f.read().splitlines() if ln.strip()]
             assert lines[0].startswith("lift_m,q_m3s_ref,A_ref_key,Cd_ref,V_ref,Mach_ref,SR")
             assert len(lines) > 1
+
+
+def test_report_write_csv_matches_csv_writer() -> None:
+    import csv
+    import io
+
+    from iop_flow_gui.wizard.step_report import StepReport
+
+    headers = ["lift_m", "A_ref_key", "SR"]
+    cases = [
+        [[0.001, "throat", None], [0.0025, "curtain", 0.75]],
+        [[0.001, 'a,"b"', None], [0.002, "x\ny", 1.0]],  # needs quoting -> csv.writer
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "intake.csv")
+        for rows in cases:
+            StepReport._write_csv(path, headers, rows)
+            ref = io.StringIO(newline="")
+            w = csv.writer(ref)
+            w.writerow(headers)
+            w.writerows(rows)
+            with open(path, "rb") as fb:
+                assert fb.read() == b"\xef\xbb\xbf" + ref.getvalue().encode("utf-8")
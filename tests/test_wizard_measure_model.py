@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import Qt  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from iop_flow_gui.wizard.measure_model import MeasureTableModel, array_to_rows  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def qapp():  # type: ignore[annotation-unchecked]
+    app = QApplication.instance() or QApplication(sys.argv)
+    yield app
+
+
+def test_array_to_rows_dedup_sort_and_filters() -> None:
+    nan = np.nan
+    arr = np.array(
+        [
+            [2.0, 100.0, 28.0, nan],
+            [1.0, -5.0, 0.0, 10.0],
+            [2.0, 110.0, nan, -1.0],  # same lift: last one wins
+            [nan, 50.0, 28.0, 0.0],  # no lift -> skipped
+            [3.0, nan, 28.0, 0.0],  # no q -> skipped
+        ]
+    )
+    rows = array_to_rows(arr)
+    assert rows == [
+        {"lift_mm": 1.0, "q_cfm": 0.0, "swirl_rpm": 10.0},
+        {"lift_mm": 2.0, "q_cfm": 110.0},
+    ]
+
+
+def test_model_set_edit_append(qapp) -> None:  # type: ignore[no-untyped-def]
+    m = MeasureTableModel()
+    m.set_rows([{"lift_mm": 1.0, "q_cfm": 50.0}, {"lift_mm": 2.0}])
+    assert m.rowCount() == 2 and m.columnCount() == 4
+    assert m.data(m.index(1, 1), Qt.DisplayRole) == ""
+    # Polish decimal comma accepted, garbage rejected
+    assert m.setData(m.index(1, 1), "75,5")
+    assert not m.setData(m.index(1, 2), "abc")
+    assert m.to_rows()[1] == {"lift_mm": 2.0, "q_cfm": 75.5}
+    m.append_array(np.array([[3.0, 90.0, 28.0, np.nan]]))
+    assert m.rowCount() == 3
+    assert m.to_rows()[-1] == {"lift_mm": 3.0, "q_cfm": 90.0, "dp_inH2O": 28.0}
+
+
+def test_model_apply_rows_diff(qapp) -> None:  # type: ignore[no-untyped-def]
+    m = MeasureTableModel()
+    m.set_rows([{"lift_mm": 1.0, "q_cfm": 50.0}, {"lift_mm": 3.0, "q_cfm": 70.0}])
+    inserted: list[tuple[int, int]] = []
+    removed: list[tuple[int, int]] = []
+    m.rowsInserted.connect(lambda _p, a, b: inserted.append((a, b)))
+    m.rowsRemoved.connect(lambda _p, a, b: removed.append((a, b)))
+    target = [{"lift_mm": 1.0, "q_cfm": 50.0}, {"lift_mm": 2.0}, {"lift_mm": 4.0}]
+    m.apply_rows(target)
+    assert removed == [(1, 1)]
+    assert inserted == [(1, 1), (2, 2)]
+    assert m.array[:, 0].tolist() == [1.0, 2.0, 4.0]
+    assert m.data(m.index(0, 1), Qt.DisplayRole) == "50.0"
+
+
+def test_delegate_paints_from_cached_roles(qapp) -> None:  # type: ignore[no-untyped-def]
+    from PySide6.QtWidgets import QTableView
+
+    from iop_flow_gui.wizard.measure_model import MULTIPLE_ROLES, MeasureItemDelegate
+
+    m = MeasureTableModel()
+    m.set_rows([{"lift_mm": 1.0, "q_cfm": 50.0}])
+    roles = m.data(m.index(0, 1), MULTIPLE_ROLES)
+    assert roles[Qt.DisplayRole] == "50.0"
+    view = QTableView()
+    view.setModel(m)
+    d = MeasureItemDelegate(m, view)
+    view.setItemDelegate(d)
+    view.resize(400, 200)
+    view.grab()  # paints through initStyleOption
+    assert d._cache
+    m.setData(m.index(0, 1), "60")
+    assert not d._cache
+
+
+def test_numeric_delegate_rejects_non_numeric_input(qapp) -> None:  # type: ignore[no-untyped-def]
+    from PySide6.QtGui import QValidator
+    from PySide6.QtWidgets import QStyleOptionViewItem, QTableWidget
+
+    from iop_flow_gui.wizard.measure_model import NumericItemDelegate
+
+    table = QTableWidget(1, 4)
+    d = NumericItemDelegate(table)
+    editor = d.createEditor(table.viewport(), QStyleOptionViewItem(), table.model().index(0, 1))
+    val = editor.validator()
+    # Both decimal separators and thousand spaces pass; letters and a second separator do not
+    assert val.validate("1 234,5", 0)[0] == QValidator.Acceptable
+    assert val.validate("12.5", 0)[0] == QValidator.Acceptable
+    assert val.validate("", 0)[0] == QValidator.Acceptable
+    assert val.validate("12a", 0)[0] == QValidator.Invalid
+    assert val.validate("1,2,3", 0)[0] == QValidator.Invalid
+
+
+def test_parse_rows_array_matches_parse_rows() -> None:
+    from iop_flow_gui.wizard.measure_model import parse_rows_array
+    from iop_flow_gui.wizard.state import parse_rows
+
+    texts = [
+        "1,0\t100,0\t28,0\n2.0\t160.5\t28\n\n3,1234 200 28 800\n",  # ragged -> fallback
+        "1,0\t100,0\t28,0\n2.0\t160.5\t0\n3,1234\t-1\t28\n4\t50\t28\n",  # block + filters
+        "1,0;100,0;;900\nbad;row\n",  # semicolons -> fallback
+        "",
+    ]
+    for text in texts:
+        expected = [
+            [v if v is not None else np.nan for v in row] for row in parse_rows(text)
+        ]
+        got = parse_rows_array(text)
+        assert got.shape == (len(expected), 4)
+        if expected:
+            np.testing.assert_array_equal(got, np.array(expected))
+
+
+def test_measure_columns_roundtrip_and_counts() -> None:
+    from iop_flow_gui.wizard.measure_model import MeasureColumns
+
+    rows = [
+        {"lift_mm": 1.0, "q_cfm": 50.0, "dp_inH2O": 28.0},
+        {"lift_mm": 2.0, "q_cfm": 75.0, "swirl_rpm": 900.0},
+        {"lift_mm": 3.0, "q_cfm": 90.0, "dp_inH2O": 27.5, "swirl_rpm": 0.0},
+    ]
+    cols = MeasureColumns.from_rows(rows)
+    assert len(cols) == 3
+    assert cols.count_dp() == 2 and cols.count_swirl() == 2
+    assert cols.to_rows() == rows
+
+
+def test_model_marks_invalid_cells(qapp) -> None:  # type: ignore[no-untyped-def]
+    m = MeasureTableModel(header_tips=["a", "b", "c", "d"], mark_invalid=True)
+    m.set_rows([{"lift_mm": 1.0, "q_cfm": 50.0, "dp_inH2O": 28.0}, {"lift_mm": 2.0}])
+    assert m.data(m.index(0, 1), Qt.BackgroundRole) is None
+    # Missing q is invalid, missing dp/swirl is fine
+    assert m.data(m.index(1, 1), Qt.ToolTipRole) == ">= 0"
+    assert m.data(m.index(1, 2), Qt.BackgroundRole) is None
+    assert m.setData(m.index(0, 2), "0")
+    assert m.data(m.index(0, 2), Qt.ToolTipRole) == "> 0 lub puste"
+    # Only a flipped flag repaints the background
+    roles: list[list[int]] = []
+    m.dataChanged.connect(lambda _a, _b, r: roles.append(list(r)))
+    assert m.setData(m.index(0, 1), "60")
+    assert m.setData(m.index(0, 2), "28")
+    assert Qt.BackgroundRole not in roles[0] and Qt.BackgroundRole in roles[1]
+    assert m.headerData(1, Qt.Horizontal, Qt.ToolTipRole) == "b"
+    # Marking is opt-in
+    plain = MeasureTableModel()
+    plain.set_rows([{"lift_mm": 2.0}])
+    assert plain.data(plain.index(0, 1), Qt.BackgroundRole) is None
+
+
+def test_plan_model_set_rows_and_edit(qapp) -> None:  # type: ignore[no-untyped-def]
+    from iop_flow_gui.wizard.measure_model import PlanTableModel
+
+    m = PlanTableModel()
+    m.set_rows([1.0, 2.5], [28.0, None])
+    assert m.rowCount() == 2 and m.columnCount() == 2
+    assert m.data(m.index(0, 1), Qt.DisplayRole) == "28.000"
+    assert m.data(m.index(1, 1), Qt.DisplayRole) == ""
+    edited: list[int] = []
+    m.sig_edited.connect(lambda: edited.append(1))
+    assert m.setData(m.index(1, 0), "3,25")
+    assert not m.setData(m.index(1, 1), "abc")
+    assert m.array[:, 0].tolist() == [1.0, 3.25] and edited == [1]
+    rev = m.revision
+    assert not m.setData(m.index(0, 0), "x") and m.revision == rev
+    m.set_rows([1.0], [None])
+    assert m.revision == rev + 1
+
+
+def test_parse_rows_counted_reports_rejects() -> None:
+    from iop_flow_gui.wizard.measure_model import parse_rows_array_counted
+    from iop_flow_gui.wizard.state import parse_rows_counted
+
+    text = "1;100;28\nbad;row\n2;-5\n3;120;0\nlonely\n"
+    rows, bad = parse_rows_counted(text)
+    assert len(rows) == 1 and bad == 3
+    block, bad = parse_rows_array_counted(text)
+    assert block.shape[0] == 1 and bad == 3
+    # Rectangular block path counts rows dropped by validation
+    block, bad = parse_rows_array_counted("1\t100\t28\n2\t-1\t28\n3\t90\t28\n")
+    assert block.shape[0] == 2 and bad == 1
+
+
+def test_merge_lifts_two_pointer() -> None:
+    from iop_flow_gui.wizard.measure_model import merge_lifts
+
+    rows = [{"lift_mm": 1.0, "q_cfm": 50.0}, {"lift_mm": 3.0, "q_cfm": 90.0}]
+    merged = merge_lifts(rows, [4.0, 0.1 + 0.2, 1.0, 2.0, 2.0])
+    assert [r["lift_mm"] for r in merged] == [0.1 + 0.2, 1.0, 2.0, 3.0, 4.0]
+    assert merged[1] is rows[0] and merged[3] is rows[1]
+    assert merge_lifts(rows, [3.0, 1.0]) is rows
+
+
+def test_saved_lifts_round_like_state() -> None:
+    from iop_flow_gui.wizard.measure_model import clean_array, parse_rows_array_counted
+    from iop_flow_gui.wizard.state import parse_rows
+
+    # x.xxx5 lifts: np.round would give 1.87 where the state's round gives 1.871
+    cleaned = clean_array(np.array([[1.8705, 100.0, np.nan, np.nan]]))
+    assert cleaned[0, 0] == round(1.8705, 3)
+    block, _ = parse_rows_array_counted("1.8705\t100\t28\n2.0005\t120\t28\n")
+    assert block[:, 0].tolist() == [row[0] for row in parse_rows("1.8705;100;28\n2.0005;120;28")]
@@ -13,6 +13,17 @@ def test_parse_rows_variants() -> None:
     assert rows2 == [(3.5, 220.0, None, 900.0)]
 
 
+def test_try_parse_float_pl_partial_input() -> None:
+    from iop_flow_gui.wizard.state import try_parse_float_pl
+
+    assert try_parse_float_pl(" 12,5 ") == 12.5
+    assert try_parse_float_pl("1\xa0000.25") == 1000.25
+    assert try_parse_float_pl("1,") == 1.0
+    assert try_parse_float_pl("2e3") == 2000.0
+    for partial in ("", "-", ",", "1e", "abc", "1.2.3"):
+        assert try_parse_float_pl(partial) is None
+
+
 def _minimal_state_with_steps_1_to_5() -> WizardState:
     s = WizardState()
     # Step 1 meta